@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Concurrent load test for the SIS, LMS and State APIs.
+
+Mixes three workloads per API - deep offset pagination, per-student detail
+lookups and filtered list queries - at a configurable concurrency, then reports
+p50/p95/p99 latency, throughput, error rate and peak server RSS per endpoint.
+Exits non-zero when a latency budget or the error-rate budget is exceeded.
+
+Servers run either in-process (ASGI transport, no sockets) or as uvicorn
+subprocesses on free localhost ports. No outside services are needed. Per-server
+RSS is only measured in localhost mode; in-process, the apps share the load
+generator's process, so a single peak RSS for that process is reported.
+
+Usage:
+    uv run python scripts/load_test.py --concurrency 32 --duration 20
+    uv run python scripts/load_test.py --mode localhost --p95-ms 250 --p99-ms 500
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+API_DIR = Path(__file__).parent.parent
+DATA_DIR = API_DIR / "data"
+
+# service name -> uvicorn module
+SERVICES = {
+    "sis": "sis",
+    "lms": "lms",
+    "state": "state",
+}
+
+PAGE_SIZE = 100
+RSS_SAMPLE_INTERVAL = 0.05
+
+
+@dataclass
+class Workload:
+    """One request shape against one service."""
+
+    name: str
+    service: str
+    make_path: Callable[[random.Random], str]
+    weight: int = 1
+
+
+@dataclass
+class Stats:
+    """Results collected for one workload."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    in_flight: int = 0
+    peak_rss: int | None = None
+
+
+def build_workloads() -> list[Workload]:
+    """Build the workload mix from the same parquet files the APIs serve."""
+    attendance = pd.read_parquet(DATA_DIR / "attendance.parquet")
+    gradebook = pd.read_parquet(DATA_DIR / "gradebook.parquet")
+    isat = pd.read_parquet(DATA_DIR / "isat_data.parquet")
+
+    student_ids = attendance["student_id"].unique().tolist()
+    course_ids = attendance["course_id"].unique().tolist()
+    teachers = gradebook["teacher"].unique().tolist()
+    eduids = isat["eduid"].unique().tolist()
+    math_levels = isat["math_performance_level"].unique().tolist()
+
+    def deep_offset(endpoint: str, total: int) -> Callable[[random.Random], str]:
+        # Offsets in the back half of the table, where slicing costs the most
+        return lambda rng: f"{endpoint}?limit={PAGE_SIZE}&offset={rng.randrange(total // 2, total)}"
+
+    return [
+        Workload("sis deep offset", "sis", deep_offset("/attendance", len(attendance))),
+        Workload("sis student detail", "sis", lambda rng: f"/attendance/{rng.choice(student_ids)}", 2),
+        Workload(
+            "sis filtered list",
+            "sis",
+            lambda rng: f"/attendance?course_id={rng.choice(course_ids)}&limit={PAGE_SIZE}",
+        ),
+        Workload("lms deep offset", "lms", deep_offset("/gradebook", len(gradebook))),
+        Workload("lms student detail", "lms", lambda rng: f"/gradebook/{rng.choice(student_ids)}", 2),
+        Workload(
+            "lms filtered list",
+            "lms",
+            lambda rng: f"/gradebook?teacher={rng.choice(teachers)}&limit={PAGE_SIZE}",
+        ),
+        Workload("state deep offset", "state", deep_offset("/isat", len(isat))),
+        Workload("state student detail", "state", lambda rng: f"/isat/{rng.choice(eduids)}", 2),
+        Workload(
+            "state filtered list",
+            "state",
+            lambda rng: f"/isat?math_level={rng.choice(math_levels)}&limit={PAGE_SIZE}",
+        ),
+    ]
+
+
+def rss_bytes(pid: int) -> int | None:
+    """Resident set size of a process, or None where it can't be read."""
+    status = Path(f"/proc/{pid}/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+        return None
+    try:
+        output = subprocess.run(
+            ["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True, check=True
+        ).stdout
+        return int(output.strip()) * 1024
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class InProcessServers:
+    """All three apps in this process, called through the ASGI transport."""
+
+    async def __aenter__(self) -> dict[str, tuple[httpx.AsyncClient, int | None]]:
+        sys.path.insert(0, str(API_DIR))
+        self.clients = {}
+        for service, module in SERVICES.items():
+            app = __import__(module).app
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url=f"http://{service}"
+            )
+            # No server process of its own; run_load measures this process instead
+            self.clients[service] = (client, None)
+        return self.clients
+
+    async def __aexit__(self, *exc) -> None:
+        for client, _ in self.clients.values():
+            await client.aclose()
+
+
+class LocalhostServers:
+    """Each app in its own uvicorn subprocess on a free localhost port."""
+
+    def __init__(self, concurrency: int):
+        self.limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async def __aenter__(self) -> dict[str, tuple[httpx.AsyncClient, int]]:
+        self.processes = []
+        self.clients = {}
+        for service, module in SERVICES.items():
+            port = free_port()
+            process = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", f"{module}:app",
+                 "--port", str(port), "--log-level", "warning"],
+                cwd=API_DIR,
+            )
+            self.processes.append(process)
+            client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=self.limits)
+            self.clients[service] = (client, process.pid)
+        for service, (client, _) in self.clients.items():
+            await self._wait_healthy(service, client)
+        return self.clients
+
+    async def _wait_healthy(self, service: str, client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/")).json().get("status") == "healthy":
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+        raise RuntimeError(f"{service} API did not become healthy within {timeout:.0f}s")
+
+    async def __aexit__(self, *exc) -> None:
+        for client, _ in self.clients.values():
+            await client.aclose()
+        for process in self.processes:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+async def run_load(
+    servers: dict[str, tuple[httpx.AsyncClient, int | None]],
+    workloads: list[Workload],
+    concurrency: int,
+    duration: float,
+    seed: int,
+) -> tuple[dict[str, Stats], float, int | None]:
+    """Drive the workload mix for `duration` seconds.
+
+    Returns per-workload stats, elapsed time, and the peak RSS of this process
+    when the servers run in it (None otherwise).
+    """
+    stats = {w.name: Stats() for w in workloads}
+    in_process = any(pid is None for _, pid in servers.values())
+    process_peak_rss = None
+    weights = [w.weight for w in workloads]
+    deadline = time.perf_counter() + duration
+    done = asyncio.Event()
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed + index)
+        while time.perf_counter() < deadline:
+            workload = rng.choices(workloads, weights)[0]
+            client, _ = servers[workload.service]
+            result = stats[workload.name]
+            path = workload.make_path(rng)
+            result.in_flight += 1
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    result.errors += 1
+            except httpx.HTTPError:
+                result.errors += 1
+            finally:
+                result.latencies.append(time.perf_counter() - start)
+                result.in_flight -= 1
+
+    async def sample_rss() -> None:
+        nonlocal process_peak_rss
+        while not done.is_set():
+            if in_process:
+                rss = await asyncio.to_thread(rss_bytes, os.getpid())
+                if rss is not None:
+                    process_peak_rss = max(process_peak_rss or 0, rss)
+            for service, (_, pid) in servers.items():
+                if pid is None:
+                    continue
+                rss = await asyncio.to_thread(rss_bytes, pid)
+                if rss is None:
+                    continue
+                for workload in workloads:
+                    result = stats[workload.name]
+                    if workload.service == service and result.in_flight:
+                        result.peak_rss = max(result.peak_rss or 0, rss)
+            await asyncio.sleep(RSS_SAMPLE_INTERVAL)
+
+    sampler = asyncio.create_task(sample_rss())
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await sampler
+    return stats, elapsed, process_peak_rss
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def report(
+    stats: dict[str, Stats],
+    elapsed: float,
+    process_peak_rss: int | None,
+    args: argparse.Namespace,
+) -> list[str]:
+    """Print the results table and return any budget violations."""
+    header = f"{'endpoint':<22}{'requests':>9}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}{'rss MB':>9}"
+    print(header)
+    print("-" * len(header))
+
+    violations = []
+    for name, result in stats.items():
+        count = len(result.latencies)
+        p50, p95, p99 = (percentile(result.latencies, p) * 1000 for p in (50, 95, 99))
+        error_rate = result.errors / count if count else 0.0
+        rss = f"{result.peak_rss / 1024 / 1024:.0f}" if result.peak_rss else "n/a"
+        print(
+            f"{name:<22}{count:>9}{count / elapsed:>9.1f}{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}"
+            f"{error_rate:>8.1%}{rss:>9}"
+        )
+
+        if args.p50_ms is not None and p50 > args.p50_ms:
+            violations.append(f"{name}: p50 {p50:.1f}ms > {args.p50_ms}ms")
+        if args.p95_ms is not None and p95 > args.p95_ms:
+            violations.append(f"{name}: p95 {p95:.1f}ms > {args.p95_ms}ms")
+        if args.p99_ms is not None and p99 > args.p99_ms:
+            violations.append(f"{name}: p99 {p99:.1f}ms > {args.p99_ms}ms")
+        if error_rate > args.max_error_rate:
+            violations.append(f"{name}: error rate {error_rate:.1%} > {args.max_error_rate:.1%}")
+
+    total = sum(len(r.latencies) for r in stats.values())
+    print("-" * len(header))
+    print(f"{'total':<22}{total:>9}{total / elapsed:>9.1f}")
+    if process_peak_rss:
+        print(
+            f"\nPeak RSS of this process (load generator and all three in-process APIs): "
+            f"{process_peak_rss / 1024 / 1024:.0f} MB"
+        )
+    return violations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=["inprocess", "localhost"], default="inprocess",
+                        help="Run apps in-process (ASGI) or as uvicorn subprocesses")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test length in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the request mix")
+    parser.add_argument("--p50-ms", type=float, default=None, help="p50 latency budget per endpoint")
+    parser.add_argument("--p95-ms", type=float, default=None, help="p95 latency budget per endpoint")
+    parser.add_argument("--p99-ms", type=float, default=None, help="p99 latency budget per endpoint")
+    parser.add_argument("--max-error-rate", type=float, default=0.0,
+                        help="Allowed error rate per endpoint (0.01 = 1%%)")
+    args = parser.parse_args()
+
+    workloads = build_workloads()
+    servers = InProcessServers() if args.mode == "inprocess" else LocalhostServers(args.concurrency)
+
+    async def run() -> tuple[dict[str, Stats], float, int | None]:
+        async with servers as clients:
+            return await run_load(clients, workloads, args.concurrency, args.duration, args.seed)
+
+    print(f"Load testing {args.mode} APIs: concurrency={args.concurrency}, duration={args.duration:.0f}s")
+    print()
+    stats, elapsed, process_peak_rss = asyncio.run(run())
+    violations = report(stats, elapsed, process_peak_rss, args)
+
+    print()
+    if violations:
+        print("FAIL: budget exceeded")
+        for violation in violations:
+            print(f"  {violation}")
+        return 1
+    print("PASS: all endpoints within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
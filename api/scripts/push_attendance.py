@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Push simulated attendance changes to the SIS API.
+
+Posts random Present/Absent corrections for enrolled students at a steady
+rate, so the Dagster attendance_events_sensor has something to micro-batch.
+
+Usage:
+    uv run python scripts/push_attendance.py --rate 5 --duration 60
+    uv run python scripts/push_attendance.py --url http://localhost:8001 --batch 20
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+ENROLLMENT_KEY = ["student_id", "course_id", "section_id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8001", help="SIS API base URL")
+    parser.add_argument("--rate", type=float, default=2.0, help="Requests per second")
+    parser.add_argument("--batch", type=int, default=1, help="Events per request")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    attendance = pd.read_parquet(DATA_DIR / "attendance.parquet")
+    enrollments = list(attendance[ENROLLMENT_KEY].itertuples(index=False, name=None))
+    school_days = [c for c in attendance.columns if c not in ("student_name", *ENROLLMENT_KEY)]
+    rng = random.Random(args.seed)
+
+    sent = 0
+    deadline = time.monotonic() + args.duration
+    with httpx.Client(base_url=args.url, timeout=10.0) as client:
+        while time.monotonic() < deadline:
+            events = []
+            for _ in range(args.batch):
+                student_id, course_id, section_id = rng.choice(enrollments)
+                events.append({
+                    "student_id": int(student_id),
+                    "course_id": course_id,
+                    "section_id": section_id,
+                    "date": rng.choice(school_days),
+                    "status": rng.choice(["Present", "Absent"]),
+                })
+            response = client.post("/attendance/events", json=events)
+            response.raise_for_status()
+            sent += len(events)
+            time.sleep(1 / args.rate)
+
+    print(f"Pushed {sent} attendance events to {args.url}")
+
+
+if __name__ == "__main__":
+    main()
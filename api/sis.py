@@ -3,11 +3,15 @@ SIS (Student Information System) API - serves attendance data.
 """
 
 import json
+import os
+import threading
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import pandas as pd
 from fastapi import FastAPI, HTTPException, Query
+from pydantic import BaseModel
 
 
 def df_to_records(df: pd.DataFrame) -> list[dict]:
@@ -23,6 +27,11 @@ app = FastAPI(
 
 DATA_DIR = Path(__file__).parent / "data"
 
+# Append-only log of pushed attendance events (stand-in for a real push source)
+EVENT_LOG = Path(os.environ.get("SIS_EVENT_LOG", DATA_DIR / "attendance_events.jsonl"))
+
+ENROLLMENT_KEY = ["student_id", "course_id", "section_id"]
+
 
 def load_parquet(name: str) -> pd.DataFrame:
     """Load a parquet file from the data directory."""
@@ -32,13 +41,107 @@ def load_parquet(name: str) -> pd.DataFrame:
     return pd.read_parquet(path)
 
 
+class AttendanceEvent(BaseModel):
+    """A change to one student's attendance on one school day."""
+
+    student_id: int
+    course_id: str
+    section_id: str
+    date: date
+    status: Literal["Present", "Absent"]
+
+
+class EventLog:
+    """Append-only JSON Lines log addressed by byte offset.
+
+    Each event's ``offset`` is the byte position of its line, so a consumer
+    resumes from the last offset it saw without the log being re-read.
+    Events are also folded into a latest-status overlay that the attendance
+    endpoints apply, keeping pulls consistent with what was pushed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        # (student_id, course_id, section_id) -> {date column: status}
+        self._overlay: dict[tuple, dict[str, str]] = {}
+        self._overlay_end = 0
+        self.last_offset = -1
+
+    def append(self, events: list[AttendanceEvent]) -> list[int]:
+        """Append events and return their offsets."""
+        received_at = datetime.now(timezone.utc).isoformat()
+        offsets = []
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as file:
+                for event in events:
+                    offset = file.tell()
+                    record = {"offset": offset, "received_at": received_at, **event.model_dump(mode="json")}
+                    file.write((json.dumps(record) + "\n").encode())
+                    offsets.append(offset)
+                file.flush()
+                os.fsync(file.fileno())
+        return offsets
+
+    def read(self, after: int, limit: int) -> list[dict]:
+        """Up to `limit` events with an offset greater than `after`."""
+        events = []
+        with self._lock:
+            if not self.path.exists():
+                return events
+            with open(self.path, "rb") as file:
+                file.seek(max(after, 0))
+                if after >= 0:
+                    file.readline()  # the event at `after` was already consumed
+                while len(events) < limit:
+                    line = file.readline()
+                    if not line.endswith(b"\n"):
+                        break
+                    events.append(json.loads(line))
+        return events
+
+    def overlay(self) -> dict[tuple, dict[str, str]]:
+        """Latest pushed status per enrollment and day, refreshed from the log's tail."""
+        with self._lock:
+            if self.path.exists():
+                with open(self.path, "rb") as file:
+                    file.seek(self._overlay_end)
+                    for line in file:
+                        if not line.endswith(b"\n"):
+                            break
+                        event = json.loads(line)
+                        key = (event["student_id"], event["course_id"], event["section_id"])
+                        self._overlay.setdefault(key, {})[event["date"]] = event["status"]
+                        self.last_offset = event["offset"]
+                        self._overlay_end += len(line)
+            return {key: dict(days) for key, days in self._overlay.items()}
+
+
+event_log = EventLog(EVENT_LOG)
+
+
+def load_attendance() -> pd.DataFrame:
+    """Attendance with pushed events applied on top of the seed data."""
+    df = load_parquet("attendance")
+    overlay = event_log.overlay()
+    if overlay:
+        df = df.set_index(ENROLLMENT_KEY)
+        for key, days in overlay.items():
+            if key in df.index:
+                for day, status in days.items():
+                    df.loc[key, day] = status
+        df = df.reset_index()
+    return df
+
+
 @app.get("/")
 def root():
     """API health check."""
     return {
         "status": "healthy",
         "system": "SIS",
-        "endpoints": ["/attendance"],
+        "endpoints": ["/attendance", "/attendance/events"],
     }
 
 
@@ -50,7 +153,7 @@ def get_attendance(
     offset: int = Query(0, ge=0),
 ):
     """Get attendance records."""
-    df = load_parquet("attendance")
+    df = load_attendance()
 
     if student_id:
         df = df[df["student_id"] == student_id]
@@ -68,10 +171,43 @@ def get_attendance(
     }
 
 
+@app.post("/attendance/events", status_code=201)
+def post_attendance_events(events: list[AttendanceEvent]):
+    """Record attendance changes; they are visible to /attendance immediately."""
+    df = load_parquet("attendance")
+    enrollments = set(df[ENROLLMENT_KEY].itertuples(index=False, name=None))
+    school_days = set(df.columns.drop(["student_name", *ENROLLMENT_KEY]))
+    for event in events:
+        if (event.student_id, event.course_id, event.section_id) not in enrollments:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Student {event.student_id} is not enrolled in {event.course_id} {event.section_id}",
+            )
+        if event.date.isoformat() not in school_days:
+            raise HTTPException(status_code=422, detail=f"{event.date} is not a school day")
+
+    offsets = event_log.append(events)
+    return {"accepted": len(offsets), "offsets": offsets}
+
+
+@app.get("/attendance/events")
+def get_attendance_events(
+    after: int = Query(-1, ge=-1, description="Return events after this offset (-1 = from the start)"),
+    limit: int = Query(1000, ge=1, le=10000),
+):
+    """Read pushed attendance events in log order."""
+    events = event_log.read(after, limit)
+    event_log.overlay()  # bring last_offset up to date
+    return {
+        "data": events,
+        "last_offset": event_log.last_offset,
+    }
+
+
 @app.get("/attendance/{student_id}")
 def get_student_attendance(student_id: int):
     """Get attendance for a specific student."""
-    df = load_parquet("attendance")
+    df = load_attendance()
     student_df = df[df["student_id"] == student_id]
 
     if student_df.empty:
@@ -11,6 +11,11 @@ Write-Host "  - api\.venv\         (API dependencies)"
 Write-Host "  - dagster-demo\.venv\ (Dagster dependencies)"
 Write-Host "  - dbt-demo\.venv\    (dbt dependencies)"
 Write-Host "  - dbt-demo\dev.duckdb (database)"
+Write-Host "  - dbt-demo\dev.duckdb.profiles\ (query profiles)"
+Write-Host "  - dbt-demo\shards\   (sharded-mode Parquet)"
+Write-Host "  - dbt-demo\warehouse\ (blue/green warehouse versions)"
+Write-Host "  - dbt-demo\exports\  (Parquet export)"
+Write-Host "  - api\data\attendance_events.jsonl (pushed attendance events)"
 Write-Host "  - dagster-demo\...\DbtProjectComponent cache"
 Write-Host ""
 
@@ -27,6 +32,12 @@ if ($confirm -eq "y" -or $confirm -eq "Y") {
         @{Path="dbt-demo\.venv"; Name="dbt-demo\.venv"},
         @{Path="dbt-demo\dev.duckdb"; Name="dbt-demo\dev.duckdb"},
         @{Path="dbt-demo\dev.duckdb.wal"; Name="dbt-demo\dev.duckdb.wal"},
+        @{Path="dbt-demo\dev.duckdb.tmp"; Name="dbt-demo\dev.duckdb.tmp"},
+        @{Path="dbt-demo\dev.duckdb.profiles"; Name="dbt-demo\dev.duckdb.profiles"},
+        @{Path="dbt-demo\shards"; Name="dbt-demo\shards"},
+        @{Path="dbt-demo\warehouse"; Name="dbt-demo\warehouse"},
+        @{Path="dbt-demo\exports"; Name="dbt-demo\exports"},
+        @{Path="api\data\attendance_events.jsonl"; Name="api\data\attendance_events.jsonl"},
         @{Path="dagster-demo\src\dagster_demo\defs\.local_defs_state"; Name="DbtProjectComponent cache"},
         @{Path="dbt-demo\target"; Name="dbt-demo\target"},
         @{Path="dbt-demo\logs"; Name="dbt-demo\logs"}
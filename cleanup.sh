@@ -19,6 +19,11 @@ echo "  - api/.venv/         (API dependencies)"
 echo "  - dagster-demo/.venv/ (Dagster dependencies)"
 echo "  - dbt-demo/.venv/    (dbt dependencies)"
 echo "  - dbt-demo/dev.duckdb (database)"
+echo "  - dbt-demo/dev.duckdb.profiles/ (query profiles)"
+echo "  - dbt-demo/shards/   (sharded-mode Parquet)"
+echo "  - dbt-demo/warehouse/ (blue/green warehouse versions)"
+echo "  - dbt-demo/exports/  (Parquet export)"
+echo "  - api/data/attendance_events.jsonl (pushed attendance events)"
 echo "  - dagster-demo/.../DbtProjectComponent cache"
 echo ""
 read -p "Continue? (y/N) " -n 1 -r
@@ -34,6 +39,12 @@ if [[ $REPLY =~ ^[Yy]$ ]]; then
     rm -rf dbt-demo/.venv && echo -e "${GREEN}✓${NC} Removed dbt-demo/.venv"
     rm -f dbt-demo/dev.duckdb && echo -e "${GREEN}✓${NC} Removed dbt-demo/dev.duckdb"
     rm -f dbt-demo/dev.duckdb.wal && echo -e "${GREEN}✓${NC} Removed dbt-demo/dev.duckdb.wal"
+    rm -rf dbt-demo/dev.duckdb.tmp && echo -e "${GREEN}✓${NC} Removed dbt-demo/dev.duckdb.tmp"
+    rm -rf dbt-demo/dev.duckdb.profiles && echo -e "${GREEN}✓${NC} Removed dbt-demo/dev.duckdb.profiles"
+    rm -rf dbt-demo/shards && echo -e "${GREEN}✓${NC} Removed dbt-demo/shards"
+    rm -rf dbt-demo/warehouse && echo -e "${GREEN}✓${NC} Removed dbt-demo/warehouse"
+    rm -rf dbt-demo/exports && echo -e "${GREEN}✓${NC} Removed dbt-demo/exports"
+    rm -f api/data/attendance_events.jsonl && echo -e "${GREEN}✓${NC} Removed api/data/attendance_events.jsonl"
     rm -rf dagster-demo/src/dagster_demo/defs/.local_defs_state && echo -e "${GREEN}✓${NC} Removed DbtProjectComponent cache"
     rm -rf dbt-demo/target && echo -e "${GREEN}✓${NC} Removed dbt-demo/target"
     rm -rf dbt-demo/logs && echo -e "${GREEN}✓${NC} Removed dbt-demo/logs"
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Import-time report for the Dagster code location.
+
+Loads `dagster_demo.definitions` in a fresh interpreter with `-X importtime`
+(the same work `dg dev` and every multiprocess-executor step subprocess do) and
+reports wall time, the slowest top-level imports, and whether any library that
+should be imported lazily was pulled in at load time.
+
+Usage:
+    uv run python scripts/import_report.py [--top 15]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+
+# Libraries only needed while an asset runs
+LAZY_MODULES = ("pandas", "duckdb", "httpx")
+
+LOAD_SNIPPET = """
+import time
+start = time.perf_counter()
+import dagster_demo.definitions as module
+imported = time.perf_counter()
+module.defs()
+loaded = time.perf_counter()
+print(f"import={imported - start:.3f} load={loaded - imported:.3f}")
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Parse `-X importtime` lines into (module, self_us, cumulative_us, depth)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top", type=int, default=15, help="Number of imports to list")
+    args = parser.parse_args()
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOAD_SNIPPET],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        return result.returncode
+
+    timings = dict(part.split("=") for part in result.stdout.split()[-2:])
+    rows = parse_importtime(result.stderr)
+    top_level = sorted(
+        {r[0]: r for r in rows if r[3] <= 1}.values(), key=lambda r: r[2], reverse=True
+    )
+
+    print(f"Module import:        {float(timings['import']):.2f}s")
+    print(f"Definitions load:     {float(timings['load']):.2f}s")
+    print()
+    print("Slowest top-level imports (cumulative):")
+    for name, _, cumulative_us, _ in top_level[: args.top]:
+        print(f"  {cumulative_us / 1e6:7.3f}s  {name}")
+
+    eager = [name for name in LAZY_MODULES if any(r[0] == name for r in rows)]
+    print()
+    if eager:
+        print(f"Imported at load time (should be lazy): {', '.join(eager)}")
+        return 1
+    print(f"Lazy modules not imported at load time: {', '.join(LAZY_MODULES)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
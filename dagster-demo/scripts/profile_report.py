@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Query profile report: a run's DuckDB profiles against their baselines.
+
+Reads the profiles recorded with DUCKDB_PROFILING=true (see
+`dagster_demo.profiling`), lists every dbt model and SQL statement of a run
+with its latency, baseline latency and regressions, and prints the operator
+tree of selected profiles. `--accept` makes the run's profiles the new
+baselines, e.g. after an intended model change.
+
+Usage:
+    uv run python scripts/profile_report.py
+    uv run python scripts/profile_report.py --plan fct_attendance
+    uv run python scripts/profile_report.py --accept fct_attendance
+    uv run python scripts/profile_report.py --run <run_id> --accept
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from dagster_demo.profiling import RUNS_DIR, ProfileComparison, ProfileStore, compare, operators
+
+PROJECT_DIR = Path(__file__).parent.parent
+
+DEFAULT_PROFILE_DIR = PROJECT_DIR.parent / "dbt-demo" / "dev.duckdb.profiles"
+
+
+def load_run(store: ProfileStore, run_dir: Path) -> list[tuple[ProfileComparison, dict]]:
+    """Compare every profile of a run with its baseline, without creating baselines."""
+    results = []
+    for path in sorted(run_dir.glob("*/*.json")):
+        source, name = path.parent.name, path.stem
+        profile = json.loads(path.read_text())
+        baseline_path = store.baseline_path(source, name)
+        baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+        results.append((compare(source, name, profile, baseline, store.policy), profile))
+    return results
+
+
+def print_plan(store: ProfileStore, comparison: ProfileComparison) -> None:
+    """Operator tree with per-operator time, rows and the baseline's time."""
+    baseline_path = store.baseline_path(comparison.source, comparison.name)
+    baseline = operators(json.loads(baseline_path.read_text())) if baseline_path.exists() else []
+    aligned = not comparison.plan_changed and len(baseline) == len(comparison.plan)
+
+    print(f"\n{comparison.source}/{comparison.name}" + (" (plan changed)" if comparison.plan_changed else ""))
+    print(f"  {'operator':<56} {'ms':>9} {'baseline':>9} {'rows':>12}")
+    for op in comparison.plan:
+        label = "  " * op.depth + op.name + (f" ({op.detail})" if op.detail else "")
+        before = f"{baseline[op.index].timing * 1000:.1f}" if aligned else ""
+        print(f"  {label[:56]:<56} {op.timing * 1000:>9.1f} {before:>9} {op.cardinality:>12,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--dir",
+        type=Path,
+        default=Path(os.environ.get("DUCKDB_PROFILE_DIR") or DEFAULT_PROFILE_DIR),
+        help="Profile directory (DUCKDB_PROFILE_DIR)",
+    )
+    parser.add_argument("--run", help="Dagster run ID (default: the latest profiled run)")
+    parser.add_argument("--plan", nargs="+", default=[], metavar="NAME", help="Print these profiles' operator trees")
+    parser.add_argument(
+        "--accept",
+        nargs="*",
+        metavar="NAME",
+        help="Make the run's profiles the baselines (all of them when no names are given)",
+    )
+    args = parser.parse_args()
+
+    store = ProfileStore(args.dir)
+    runs = store.runs()
+    if not runs:
+        sys.exit(f"No profiled runs under {store.root}; run Dagster with DUCKDB_PROFILING=true")
+    run_dir = store.root / RUNS_DIR / args.run if args.run else runs[0]
+    if not run_dir.is_dir():
+        sys.exit(f"No profiles for run {args.run}")
+
+    results = load_run(store, run_dir)
+    flagged = [c for c, _ in results if c.flagged]
+    print(f"Run {run_dir.name}: {len(results)} profiles, {len(flagged)} flagged")
+    print(f"(regression: > {store.policy.pct:g}% and > {store.policy.min_ms:g} ms slower than baseline)\n")
+    for comparison, _ in sorted(results, key=lambda r: (not r[0].flagged, r[0].source, r[0].name)):
+        marker = "!" if comparison.flagged else " "
+        print(f"{marker} {comparison.source:<4} {comparison.summary()}")
+
+    for comparison, _ in results:
+        if comparison.name in args.plan:
+            print_plan(store, comparison)
+
+    if args.accept is not None:
+        names = set(args.accept)
+        accepted = [(c, p) for c, p in results if not names or c.name in names]
+        for comparison, profile in accepted:
+            store.accept(comparison.source, comparison.name, profile)
+        print(f"\nAccepted {len(accepted)} profiles as baselines")
+
+
+if __name__ == "__main__":
+    main()
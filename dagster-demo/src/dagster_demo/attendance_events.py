@@ -0,0 +1,237 @@
+"""Apply pushed attendance events to raw.* and the metrics built on them.
+
+The SIS API keeps an append-only log of attendance changes. Each micro-batch
+of new events is appended to ``raw.attendance_events``; ``int_attendance_long``
+overlays the latest event per student/course/section/day, so the next dbt
+build includes them.
+
+Between builds, ``apply_events`` patches only the rows the batch touches, in
+the same transaction as the insert:
+
+1. ``fct_attendance`` rows for the changed days
+2. ``total_school_days``, ``days_absent`` and ``attendance_pct`` in
+   ``fct_student_snapshot`` for the affected enrollments, recomputed from
+   their ``fct_attendance`` rows
+3. the same metrics plus the attendance-derived flags in
+   ``mart_student_dashboard``
+
+Nothing else is rescanned or rebuilt.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import duckdb
+    import pandas as pd
+
+EVENTS_TABLE = "raw.attendance_events"
+
+EVENT_COLUMNS = {
+    "district_id": "VARCHAR",
+    # Byte offset of the event in the SIS log; increases with every event
+    "event_offset": "BIGINT",
+    "received_at": "TIMESTAMPTZ",
+    "student_id": "BIGINT",
+    "course_id": "VARCHAR",
+    "section_id": "VARCHAR",
+    "school_date": "DATE",
+    "attendance_status": "VARCHAR",
+}
+
+# Tables patched between builds (all must exist, i.e. dbt has run once)
+PATCHED_TABLES = (
+    "main_dimensions.dim_student",
+    "main_dimensions.dim_course",
+    "main_dimensions.dim_section",
+    "main_dimensions.dim_date",
+    "main_facts.fct_attendance",
+    "main_facts.fct_student_snapshot",
+    "main_marts.mart_student_dashboard",
+)
+
+
+@dataclass
+class EventBatch:
+    """What applying one micro-batch did."""
+
+    events: int
+    # Student/course/section/days whose status was written to fct_attendance
+    days_updated: int = 0
+    # Enrollments whose metrics were recomputed
+    enrollments_refreshed: int = 0
+    # Events for enrollments or days the last dbt build doesn't know yet
+    unmatched: int = 0
+
+
+def ensure_events_table(conn: "duckdb.DuckDBPyConnection") -> None:
+    """Create raw.attendance_events if it doesn't exist (dbt reads it as a source)."""
+    columns = ", ".join(f"{name} {type_}" for name, type_ in EVENT_COLUMNS.items())
+    conn.execute("CREATE SCHEMA IF NOT EXISTS raw")
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {EVENTS_TABLE} ({columns})")
+
+
+def latest_offsets(conn: "duckdb.DuckDBPyConnection") -> dict[str, int]:
+    """Offset of the newest loaded event per district."""
+    return dict(
+        conn.execute(
+            f"SELECT district_id, max(event_offset) FROM {EVENTS_TABLE} GROUP BY district_id"
+        ).fetchall()
+    )
+
+
+def _tables_exist(conn: "duckdb.DuckDBPyConnection", names: tuple[str, ...]) -> bool:
+    existing = {
+        f"{schema}.{table}"
+        for schema, table in conn.execute(
+            "SELECT schema_name, table_name FROM duckdb_tables()"
+        ).fetchall()
+    }
+    return all(name in existing for name in names)
+
+
+def apply_events(
+    conn: "duckdb.DuckDBPyConnection",
+    events: "pd.DataFrame",
+    refresh_metrics: bool = True,
+) -> EventBatch:
+    """Append a batch of events and patch the affected attendance metrics.
+
+    Args:
+        conn: Read-write connection to the database holding raw.* and the models
+        events: New events with the columns of EVENT_COLUMNS
+        refresh_metrics: Patch fct_attendance, fct_student_snapshot and
+            mart_student_dashboard (skipped anyway until dbt has built them)
+
+    Returns:
+        Counts of what was loaded and patched
+    """
+    ensure_events_table(conn)
+    conn.register("incoming", events[list(EVENT_COLUMNS)])
+    conn.execute("BEGIN")
+    try:
+        # Re-delivered events (same district and offset) are loaded once
+        conn.execute(f"""
+            CREATE OR REPLACE TEMP TABLE live_events AS
+            SELECT i.* FROM incoming i
+            ANTI JOIN {EVENTS_TABLE} e
+                ON i.district_id = e.district_id AND i.event_offset = e.event_offset
+        """)
+        conn.execute(f"INSERT INTO {EVENTS_TABLE} SELECT * FROM live_events")
+        batch = EventBatch(events=conn.execute("SELECT count(*) FROM live_events").fetchone()[0])
+
+        if batch.events and refresh_metrics and _tables_exist(conn, PATCHED_TABLES):
+            _patch_metrics(conn, batch)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.unregister("incoming")
+    return batch
+
+
+def _patch_metrics(conn: "duckdb.DuckDBPyConnection", batch: EventBatch) -> None:
+    """Rewrite the attendance rows and metrics touched by live_events."""
+    conn.execute("""
+        CREATE OR REPLACE TEMP TABLE live_latest AS
+        SELECT * FROM live_events
+        QUALIFY row_number() OVER (
+            PARTITION BY district_id, student_id, course_id, section_id, school_date
+            ORDER BY event_offset DESC
+        ) = 1
+    """)
+    # dim_section has a row per teacher, so one day can map to several section keys.
+    # Days without a fct_attendance row are left to the next build (unmatched)
+    conn.execute("""
+        CREATE OR REPLACE TEMP TABLE live_days AS
+        SELECT
+            l.district_id, l.student_id, l.course_id, l.section_id, l.school_date,
+            s.student_key, c.course_key, sec.section_key, d.date_key, l.attendance_status
+        FROM live_latest l
+        JOIN main_dimensions.dim_student s
+            ON l.district_id = s.district_id AND l.student_id = s.student_id
+        JOIN main_dimensions.dim_course c ON l.course_id = c.course_id
+        JOIN main_dimensions.dim_section sec
+            ON l.district_id = sec.district_id
+            AND l.course_id = sec.course_id
+            AND l.section_id = sec.section_id
+        JOIN main_dimensions.dim_date d ON l.school_date = d.full_date
+        SEMI JOIN main_facts.fct_attendance f
+            ON f.student_key = s.student_key
+            AND f.course_key = c.course_key
+            AND f.section_key = sec.section_key
+            AND f.date_key = d.date_key
+    """)
+    batch.days_updated, batch.enrollments_refreshed = conn.execute("""
+        SELECT
+            count(DISTINCT (district_id, student_id, course_id, section_id, school_date)),
+            count(DISTINCT (district_id, student_id, course_id, section_id))
+        FROM live_days
+    """).fetchone()
+    batch.unmatched = conn.execute("SELECT count(*) FROM live_latest").fetchone()[0] - batch.days_updated
+
+    # Same expressions as int_attendance_long / fct_attendance
+    conn.execute("""
+        UPDATE main_facts.fct_attendance f
+        SET attendance_status = l.attendance_status,
+            is_absent = l.attendance_status = 'Absent'
+        FROM live_days l
+        WHERE f.student_key = l.student_key
+            AND f.course_key = l.course_key
+            AND f.section_key = l.section_key
+            AND f.date_key = l.date_key
+    """)
+
+    # Same expressions as attendance_metrics in fct_student_snapshot
+    conn.execute("""
+        CREATE OR REPLACE TEMP TABLE live_metrics AS
+        SELECT
+            f.student_key,
+            f.course_key,
+            f.section_key,
+            count(*) AS total_school_days,
+            sum(CASE WHEN f.is_absent THEN 1 ELSE 0 END) AS days_absent,
+            round(1.0 - (sum(CASE WHEN f.is_absent THEN 1 ELSE 0 END)::numeric / count(*)), 3) AS attendance_pct
+        FROM main_facts.fct_attendance f
+        SEMI JOIN live_days l
+            ON f.student_key = l.student_key
+            AND f.course_key = l.course_key
+            AND f.section_key = l.section_key
+        GROUP BY f.student_key, f.course_key, f.section_key
+    """)
+    conn.execute("""
+        UPDATE main_facts.fct_student_snapshot s
+        SET total_school_days = m.total_school_days,
+            days_absent = m.days_absent,
+            attendance_pct = m.attendance_pct
+        FROM live_metrics m
+        WHERE s.student_key = m.student_key
+            AND s.course_key = m.course_key
+            AND s.section_key = m.section_key
+    """)
+
+    # Keep the flags in sync with mart_student_dashboard.sql
+    conn.execute("""
+        UPDATE main_marts.mart_student_dashboard d
+        SET total_school_days = m.total_school_days,
+            days_absent = m.days_absent,
+            attendance_pct = m.attendance_pct,
+            attendance_status = CASE
+                WHEN m.attendance_pct < 0.65 THEN 'Critical'
+                WHEN m.attendance_pct < 0.75 THEN 'Warning'
+                WHEN m.attendance_pct < 0.80 THEN 'Monitor'
+                ELSE 'Good'
+            END,
+            overall_risk_level = CASE
+                WHEN d.trend_status = 'Failing' THEN 'Critical'
+                WHEN d.current_grade < 60 OR m.attendance_pct < 0.65 THEN 'High'
+                WHEN d.current_grade < 70 OR m.attendance_pct < 0.75 OR d.missing_assignments_pct >= 20 THEN 'Medium'
+                WHEN d.trend_status = 'Declining' THEN 'Monitor'
+                ELSE 'On Track'
+            END
+        FROM live_metrics m
+        WHERE d.student_key = m.student_key
+            AND d.course_key = m.course_key
+            AND d.section_key = m.section_key
+    """)
@@ -0,0 +1,6 @@
+"""Custom components for the demo project."""
+
+from dagster_demo.components.blue_green_dbt_project import BlueGreenDbtProjectComponent
+from dagster_demo.components.cached_dbt_project import CachedDbtProjectComponent
+
+__all__ = ["BlueGreenDbtProjectComponent", "CachedDbtProjectComponent"]
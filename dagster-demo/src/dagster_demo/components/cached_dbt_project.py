@@ -0,0 +1,251 @@
+"""DbtProjectComponent that reuses a content-hashed dbt manifest.
+
+The stock component re-parses the dbt project (and copies it into
+``.local_defs_state``) on every `dg dev` start and code reload, and each
+multiprocess-executor step subprocess loads the code location again.
+
+Here the manifest is compiled once per project *content*: all model, macro,
+seed, snapshot and YAML files are hashed together with the dbt-core version,
+and the manifest lives in ``target/manifest_cache/<hash>/``. Every process
+with the same files reuses it; editing any of them changes the hash, so the
+next load re-parses automatically. dbt also renders ``env_var()`` and
+``--vars`` while parsing, so the values of the environment variables the
+project references and the component's static ``--vars`` are hashed too.
+
+With ``DUCKDB_PROFILING=true`` each model's DuckDB query profile is compared
+with its baseline and summarized in the model's materialization metadata (see
+``dagster_demo.profiling``).
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Optional
+
+import dagster as dg
+import yaml
+from dagster_dbt import DbtCliResource, DbtProject, DbtProjectComponent
+from dagster_dbt.dbt_project_manager import DbtProjectManager, NoopDbtProjectManager
+
+from dagster_demo.profiling import DBT_SOURCE, ProfileStore, profile_metadata
+
+MANIFEST_CACHE_DIR = "manifest_cache"
+
+# Number of cached manifests to keep (current one included)
+KEEP_MANIFESTS = 3
+
+# Project-level files that affect parsing
+PROJECT_FILES = (
+    "dbt_project.yml",
+    "profiles.yml",
+    "packages.yml",
+    "dependencies.yml",
+    "package-lock.yml",
+)
+
+# dbt_project.yml path settings and their defaults
+PROJECT_PATHS = {
+    "model-paths": ["models"],
+    "macro-paths": ["macros"],
+    "seed-paths": ["seeds"],
+    "snapshot-paths": ["snapshots"],
+    "analysis-paths": ["analyses"],
+    "test-paths": ["tests"],
+}
+
+# env_var('NAME', ...) references in project files
+ENV_VAR_PATTERN = re.compile(rb"""env_var\(\s*['"]([A-Za-z_][A-Za-z0-9_]*)['"]""")
+
+
+def project_hash(project_dir: Path, dbt_vars: str | None = None) -> str:
+    """Hash every input dbt reads when parsing the project.
+
+    Args:
+        project_dir: dbt project directory
+        dbt_vars: JSON passed to ``dbt parse --vars``, if any
+    """
+    with open(project_dir / "dbt_project.yml") as file:
+        dbt_project_yml = yaml.safe_load(file)
+
+    paths = [project_dir / name for name in PROJECT_FILES]
+    for key, default in PROJECT_PATHS.items():
+        for directory in dbt_project_yml.get(key, default):
+            paths.extend(p for p in (project_dir / directory).rglob("*") if p.is_file())
+
+    digest = hashlib.sha256(version("dbt-core").encode())
+    env_vars = set()
+    for path in sorted(p for p in set(paths) if p.exists()):
+        content = path.read_bytes()
+        digest.update(path.relative_to(project_dir).as_posix().encode())
+        digest.update(content)
+        env_vars.update(name.decode() for name in ENV_VAR_PATTERN.findall(content))
+    for name in sorted(env_vars):
+        # repr() tells an unset variable (None) from an empty one
+        digest.update(f"{name}={os.environ.get(name)!r}".encode())
+    digest.update(f"vars={dbt_vars!r}".encode())
+    return digest.hexdigest()[:16]
+
+
+def cli_vars(cli_args: list) -> str | None:
+    """The ``--vars`` in a component's ``cli_args``, unless they are templated.
+
+    Templated vars (e.g. the partition key) are only known per run and can't
+    be part of a manifest shared by every run.
+    """
+    for index, arg in enumerate(cli_args):
+        if isinstance(arg, dict) and "--vars" in arg:
+            value = arg["--vars"]
+        elif arg == "--vars" and index + 1 < len(cli_args):
+            value = cli_args[index + 1]
+        else:
+            continue
+        value = value if isinstance(value, str) else json.dumps(value, sort_keys=True)
+        return None if "{{" in value else value
+    return None
+
+
+def _prune_manifests(cache_dir: Path, keep: str) -> None:
+    """Remove all but the most recent cached manifests."""
+    entries = sorted(
+        (p for p in cache_dir.iterdir() if p.is_dir() and not p.name.startswith(".")),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for path in entries[KEEP_MANIFESTS:]:
+        if path.name != keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+@contextmanager
+def set_env(name: str, value: str) -> Iterator[None]:
+    """Set an environment variable for the dbt subprocess started inside the block."""
+    previous = os.environ.get(name)
+    os.environ[name] = value
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = previous
+
+
+def cached_manifest_project(project: DbtProject, dbt_vars: str | None = None) -> DbtProject:
+    """Return ``project`` pointed at a manifest compiled for its current inputs."""
+    digest = project_hash(project.project_dir, dbt_vars)
+    cache_dir = Path(project.target_path) / MANIFEST_CACHE_DIR
+    cached = DbtProject(
+        project_dir=project.project_dir,
+        target_path=cache_dir / digest,
+        profiles_dir=project.profiles_dir,
+        profile=project.profile,
+        target=project.target,
+        state_path=project.state_path,
+    )
+    if cached.manifest_path.exists():
+        return cached
+
+    dbt = DbtCliResource(project_dir=cached)
+    if cached.has_uninstalled_deps:
+        dbt.cli(["deps", "--quiet"], target_path=cache_dir).wait()
+
+    # Parse into a private directory and rename it into place, so concurrent
+    # processes never read a half-written manifest
+    staging = cache_dir / f".{digest}-{uuid.uuid4().hex[:8]}"
+    vars_args = ["--vars", dbt_vars] if dbt_vars else []
+    dbt.cli(["parse", "--quiet", *vars_args], target_path=staging).wait()
+    final = cached.manifest_path.parent
+    try:
+        os.replace(project.project_dir / staging, final)
+    except OSError:
+        # Another process published the same manifest first
+        shutil.rmtree(project.project_dir / staging, ignore_errors=True)
+
+    _prune_manifests(project.project_dir / cache_dir, keep=digest)
+    return cached
+
+
+@dataclass
+class CachedManifestProjectManager(DbtProjectManager):
+    """Wraps the component's project manager to resolve the cached manifest."""
+
+    manager: DbtProjectManager
+    dbt_vars: str | None = None
+
+    @property
+    def defs_state_discriminator(self) -> str:
+        return self.manager.defs_state_discriminator
+
+    def sync(self, state_path: Path) -> None:
+        self.manager.sync(state_path)
+
+    def get_project(self, state_path: Optional[Path]) -> DbtProject:
+        return cached_manifest_project(self.manager.get_project(None), self.dbt_vars)
+
+
+class CachedDbtProjectComponent(DbtProjectComponent):
+    """Expose a dbt project to Dagster, reusing a content-hashed manifest.
+
+    Drop-in replacement for ``dagster_dbt.DbtProjectComponent`` that skips the
+    ``.local_defs_state`` refresh; see the module docstring.
+    """
+
+    # DbtProjectComponent reads its project through this property and has no
+    # public hook for it; dagster-dbt is pinned in pyproject.toml so a change to
+    # it shows up as a deliberate upgrade
+    @cached_property
+    def _project_manager(self) -> DbtProjectManager:
+        manager = (
+            self.project
+            if isinstance(self.project, DbtProjectManager)
+            else NoopDbtProjectManager(self.project)
+        )
+        return CachedManifestProjectManager(manager, cli_vars(self.cli_args))
+
+    def build_defs(self, context: dg.ComponentLoadContext) -> dg.Definitions:
+        return self.build_defs_from_state(context, state_path=None)
+
+    def execute(self, context: dg.AssetExecutionContext, dbt: DbtCliResource) -> Iterator:
+        yield from self._profiled(context, super().execute(context, dbt))
+
+    def _profiled(self, context: dg.AssetExecutionContext, events: Iterator) -> Iterator:
+        """Attach each model's query profile comparison to its dbt events.
+
+        ``events`` must not have started dbt yet: the profile directory is
+        passed to the subprocess through DUCKDB_PROFILE_DIR.
+        """
+        store = ProfileStore.from_env()
+        if store is None:
+            yield from events
+            return
+
+        run_dir = store.run_dir(context.run_id, DBT_SOURCE)
+        with set_env("DUCKDB_PROFILE_DIR", str(run_dir)):
+            for event in events:
+                yield self._with_profile(context, store, run_dir, event)
+        store.prune()
+
+    @staticmethod
+    def _with_profile(context: dg.AssetExecutionContext, store: ProfileStore, run_dir: Path, event: Any) -> Any:
+        unique_id = getattr(event, "metadata", {}).get("unique_id")
+        if unique_id is None or not hasattr(event, "with_metadata"):
+            return event
+        # unique_id is "<resource_type>.<package>.<name>"; the hooks write <name>.json
+        name = str(getattr(unique_id, "value", unique_id)).split(".", 2)[2]
+        path = run_dir / f"{name}.json"
+        if not path.exists():
+            return event
+
+        comparison = store.compare(DBT_SOURCE, name, json.loads(path.read_text()))
+        if comparison.flagged:
+            context.log.warning(f"Query profile regression: {comparison.summary()}")
+        return event.with_metadata({**event.metadata, **profile_metadata([comparison])})
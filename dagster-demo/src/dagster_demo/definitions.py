@@ -1,15 +1,26 @@
+import os
 from pathlib import Path
 
 from dagster import Definitions, definitions, load_from_defs_folder, multiprocess_executor
 
+from dagster_demo.resources.districts import DistrictsResource
 from dagster_demo.resources.duckdb import DuckDBResource
 from dagster_demo.resources.sis_api import SISApiResource
 from dagster_demo.resources.lms_api import LMSApiResource
 from dagster_demo.resources.state_api import StateApiResource
+from dagster_demo.tuning import DuckDBTuning
 
 # Path to the DuckDB database used by dbt (relative to repo root)
 DUCKDB_PATH = Path(__file__).parent.parent.parent.parent / "dbt-demo" / "dev.duckdb"
 
+# One set of DuckDB settings for both DuckDBResource and the dbt subprocess
+DUCKDB_TUNING = DuckDBTuning.from_env(DUCKDB_PATH)
+DUCKDB_TUNING.export_env()
+
+# Sharded mode: set DISTRICTS_FILE to a districts YAML (see districts.example.yaml)
+DISTRICTS_FILE = os.environ.get("DISTRICTS_FILE")
+SHARD_ROOT = DUCKDB_PATH.parent / "shards"
+
 # Executor with tag-based concurrency limits (OSS alternative to Dagster+ UI)
 duckdb_executor = multiprocess_executor.configured({
     "max_concurrent": 4,
@@ -33,7 +44,16 @@ def defs():
                 "sis_api": SISApiResource(),
                 "lms_api": LMSApiResource(),
                 "state_api": StateApiResource(),
-                "duckdb": DuckDBResource(database_path=str(DUCKDB_PATH)),
+                "duckdb": DuckDBResource(
+                    database_path=str(DUCKDB_PATH),
+                    settings=DUCKDB_TUNING.settings(),
+                    profile_dir=DUCKDB_TUNING.profile_dir if DUCKDB_TUNING.profiling else None,
+                ),
+                "districts": (
+                    DistrictsResource.from_file(DISTRICTS_FILE, shard_root=str(SHARD_ROOT))
+                    if DISTRICTS_FILE
+                    else DistrictsResource(shard_root=str(SHARD_ROOT))
+                ),
             },
             executor=duckdb_executor,
         ),
@@ -2,35 +2,80 @@
 
 import dagster as dg
 
+from dagster_demo.attendance_events import ensure_events_table
+from dagster_demo.resources.districts import DEFAULT_DISTRICT, DistrictsResource
 from dagster_demo.resources.duckdb import DuckDBResource
 from dagster_demo.resources.sis_api import SISApiResource
 from dagster_demo.resources.lms_api import LMSApiResource
 from dagster_demo.resources.state_api import StateApiResource
-
-import pandas as pd
+from dagster_demo.quality import (
+    ATTENDANCE_RULES,
+    GRADEBOOK_RULES,
+    ISAT_RULES,
+    QualityRules,
+    merge_shard_check_results,
+    quality_check_specs,
+    run_quality_checks,
+)
 
 # Tag to serialize DuckDB write operations
 DUCKDB_WRITE_TAG = {"dagster/concurrency_key": "duckdb_write"}
 
 
+def _load_shards(
+    table: str,
+    rules: QualityRules,
+    duckdb: DuckDBResource,
+    districts: DistrictsResource,
+) -> dg.MaterializeResult:
+    """Sharded mode: extract every district to Parquet and union them in raw.*."""
+    extract = districts.extract(table, rules)
+    duckdb.create_parquet_view(table, districts.shard_dir(table).as_posix())
+    return dg.MaterializeResult(
+        metadata={
+            "row_count": extract.row_count,
+            "columns": extract.columns,
+            "rows_by_district": extract.rows_by_district,
+            **duckdb.profile_metadata(),
+        },
+        check_results=merge_shard_check_results(extract.checks_by_district, rules),
+    )
+
+
 @dg.asset(
     group_name="extract",
     description="Extract attendance data from SIS",
     tags=DUCKDB_WRITE_TAG,
+    check_specs=quality_check_specs("raw_attendance", ATTENDANCE_RULES),
 )
 def raw_attendance(
     sis_api: dg.ResourceParam[SISApiResource],
     duckdb: dg.ResourceParam[DuckDBResource],
+    districts: dg.ResourceParam[DistrictsResource],
 ) -> dg.MaterializeResult:
     """Extract attendance data from the SIS API and load into DuckDB."""
+    # dbt also reads pushed events; make sure the table exists before the first push
+    with duckdb.get_connection() as conn:
+        ensure_events_table(conn)
+    if districts.enabled:
+        return _load_shards("attendance", ATTENDANCE_RULES, duckdb, districts)
+
+    import pandas as pd
+
+    expected_rows = sis_api.get_attendance(limit=1)["total"]
     data = sis_api.get_all_attendance()
     df = pd.DataFrame(data)
+    check_results, null_rates = run_quality_checks(df, expected_rows, ATTENDANCE_RULES)
+    df.insert(0, "district_id", DEFAULT_DISTRICT)
     row_count = duckdb.write_dataframe(df, "attendance")
     return dg.MaterializeResult(
         metadata={
             "row_count": row_count,
             "columns": list(df.columns),
-        }
+            "null_rates": null_rates,
+            **duckdb.profile_metadata(),
+        },
+        check_results=check_results,
     )
 
 
@@ -38,21 +83,34 @@ def raw_attendance(
     group_name="extract",
     description="Extract gradebook data from LMS",
     tags=DUCKDB_WRITE_TAG,
+    check_specs=quality_check_specs("raw_gradebook", GRADEBOOK_RULES),
     deps=[raw_attendance],  # Serialize DuckDB writes
 )
 def raw_gradebook(
     lms_api: dg.ResourceParam[LMSApiResource],
     duckdb: dg.ResourceParam[DuckDBResource],
+    districts: dg.ResourceParam[DistrictsResource],
 ) -> dg.MaterializeResult:
     """Extract gradebook data from the LMS API and load into DuckDB."""
+    if districts.enabled:
+        return _load_shards("gradebook", GRADEBOOK_RULES, duckdb, districts)
+
+    import pandas as pd
+
+    expected_rows = lms_api.get_gradebook(limit=1)["total"]
     data = lms_api.get_all_gradebook()
     df = pd.DataFrame(data)
+    check_results, null_rates = run_quality_checks(df, expected_rows, GRADEBOOK_RULES)
+    df.insert(0, "district_id", DEFAULT_DISTRICT)
     row_count = duckdb.write_dataframe(df, "gradebook")
     return dg.MaterializeResult(
         metadata={
             "row_count": row_count,
             "columns": list(df.columns),
-        }
+            "null_rates": null_rates,
+            **duckdb.profile_metadata(),
+        },
+        check_results=check_results,
     )
 
 
@@ -60,19 +118,32 @@ def raw_gradebook(
     group_name="extract",
     description="Extract ISAT data from State Reporting",
     tags=DUCKDB_WRITE_TAG,
+    check_specs=quality_check_specs("raw_isat", ISAT_RULES),
     deps=[raw_gradebook],  # Serialize DuckDB writes
 )
 def raw_isat(
     state_api: dg.ResourceParam[StateApiResource],
     duckdb: dg.ResourceParam[DuckDBResource],
+    districts: dg.ResourceParam[DistrictsResource],
 ) -> dg.MaterializeResult:
     """Extract ISAT data from the State Reporting API and load into DuckDB."""
+    if districts.enabled:
+        return _load_shards("isat", ISAT_RULES, duckdb, districts)
+
+    import pandas as pd
+
+    expected_rows = state_api.get_isat(limit=1)["total"]
     data = state_api.get_all_isat()
     df = pd.DataFrame(data)
+    check_results, null_rates = run_quality_checks(df, expected_rows, ISAT_RULES)
+    df.insert(0, "district_id", DEFAULT_DISTRICT)
     row_count = duckdb.write_dataframe(df, "isat")
     return dg.MaterializeResult(
         metadata={
             "row_count": row_count,
             "columns": list(df.columns),
-        }
+            "null_rates": null_rates,
+            **duckdb.profile_metadata(),
+        },
+        check_results=check_results,
     )
@@ -0,0 +1,142 @@
+"""Near-real-time attendance: micro-batch pushed SIS events into raw.*."""
+
+import json
+from pathlib import Path
+
+import dagster as dg
+
+from dagster_demo.attendance_events import EVENT_COLUMNS, apply_events, ensure_events_table, latest_offsets
+from dagster_demo.defs.assets import DUCKDB_WRITE_TAG, raw_isat
+from dagster_demo.resources.districts import DistrictsResource
+from dagster_demo.resources.duckdb import DuckDBResource
+from dagster_demo.resources.sis_api import SISApiResource
+from dagster_demo.warehouse import WAREHOUSE_DIR, WarehouseVersions
+
+# SIS event field -> raw.attendance_events column
+EVENT_FIELDS = {
+    "offset": "event_offset",
+    "received_at": "received_at",
+    "student_id": "student_id",
+    "course_id": "course_id",
+    "section_id": "section_id",
+    "date": "school_date",
+    "status": "attendance_status",
+}
+
+# Materialization metadata: newest loaded event offset per district
+LOADED_OFFSETS = "loaded_offsets"
+
+IN_PROGRESS = [
+    dg.DagsterRunStatus.QUEUED,
+    dg.DagsterRunStatus.NOT_STARTED,
+    dg.DagsterRunStatus.STARTING,
+    dg.DagsterRunStatus.STARTED,
+]
+
+
+@dg.asset(
+    group_name="extract",
+    description="Load attendance events pushed to the SIS and patch affected students' attendance metrics",
+    tags=DUCKDB_WRITE_TAG,
+    deps=[raw_isat],  # Serialize DuckDB writes
+)
+def raw_attendance_events(
+    context: dg.AssetExecutionContext,
+    sis_api: dg.ResourceParam[SISApiResource],
+    duckdb: dg.ResourceParam[DuckDBResource],
+    districts: dg.ResourceParam[DistrictsResource],
+) -> dg.MaterializeResult:
+    """Append events newer than those already in raw.attendance_events.
+
+    In in-place mode the affected rows of fct_attendance, fct_student_snapshot
+    and mart_student_dashboard are patched in the same transaction. In
+    blue/green mode published versions are never modified; the events are
+    picked up by the next build.
+    """
+    import pandas as pd
+
+    with duckdb.get_connection() as conn:
+        ensure_events_table(conn)
+        loaded = latest_offsets(conn)
+
+    frames = []
+    for district_id, api in districts.sis_apis(sis_api).items():
+        events = api.get_all_attendance_events(after=loaded.get(district_id, -1))
+        frame = pd.DataFrame(events, columns=list(EVENT_FIELDS)).rename(columns=EVENT_FIELDS)
+        frame.insert(0, "district_id", district_id)
+        frames.append(frame)
+    events = pd.concat(frames, ignore_index=True)
+    events["received_at"] = pd.to_datetime(events["received_at"], utc=True)
+    events["school_date"] = pd.to_datetime(events["school_date"]).dt.date
+
+    database_path = Path(duckdb.database_path)
+    in_place = WarehouseVersions.from_env(database_path.parent / WAREHOUSE_DIR) is None
+    with duckdb.get_connection() as conn:
+        batch = apply_events(conn, events[list(EVENT_COLUMNS)], refresh_metrics=in_place)
+        loaded = latest_offsets(conn)
+
+    if batch.unmatched:
+        context.log.warning(
+            f"{batch.unmatched} events refer to enrollments or days missing from the last "
+            "dbt build; they will be applied by the next build"
+        )
+    return dg.MaterializeResult(
+        metadata={
+            "events": batch.events,
+            "events_by_district": events.groupby("district_id").size().to_dict(),
+            "days_updated": batch.days_updated,
+            "enrollments_refreshed": batch.enrollments_refreshed,
+            "unmatched": batch.unmatched,
+            "metrics_patched": in_place,
+            # Read by attendance_events_sensor to decide whether a batch is due
+            LOADED_OFFSETS: loaded,
+            **duckdb.profile_metadata(),
+        }
+    )
+
+
+attendance_events_job = dg.define_asset_job(
+    "attendance_events_job",
+    selection=[raw_attendance_events],
+    description="Micro-batch pushed attendance events into raw and the attendance metrics",
+)
+
+
+@dg.sensor(
+    job=attendance_events_job,
+    minimum_interval_seconds=5,
+    default_status=dg.DefaultSensorStatus.RUNNING,
+    description="Launch a micro-batch when the SIS log has new attendance events",
+)
+def attendance_events_sensor(
+    context: dg.SensorEvaluationContext,
+    sis_api: SISApiResource,
+    districts: DistrictsResource,
+) -> dg.RunRequest | dg.SkipReason:
+    """Poll the newest event offset per district and compare it with what's loaded.
+
+    The loaded offsets come from the last successful materialization of
+    raw_attendance_events, so events from a failed batch are requested again.
+    """
+    import httpx
+
+    # DuckDB allows one writer process; let the running build or batch finish first
+    if context.instance.get_runs(filters=dg.RunsFilter(statuses=IN_PROGRESS), limit=1):
+        return dg.SkipReason("Waiting for an in-progress run to release the database")
+
+    event = context.instance.get_latest_materialization_event(raw_attendance_events.key)
+    metadata = event.asset_materialization.metadata if event and event.asset_materialization else {}
+    loaded = metadata[LOADED_OFFSETS].value if LOADED_OFFSETS in metadata else {}
+
+    newest = {}
+    for district_id, api in districts.sis_apis(sis_api).items():
+        try:
+            newest[district_id] = api.get_attendance_events(after=-1, limit=1)["last_offset"]
+        except httpx.HTTPError as error:
+            return dg.SkipReason(f"SIS for district {district_id} unavailable: {error}")
+
+    if all(offset <= loaded.get(district_id, -1) for district_id, offset in newest.items()):
+        return dg.SkipReason("No new attendance events")
+
+    # No run_key: a batch that failed must be launched again for the same offsets
+    return dg.RunRequest(tags={"attendance_events/newest": json.dumps(newest, sort_keys=True)})
@@ -0,0 +1,48 @@
+"""Post-build export of marts and facts to partitioned Parquet."""
+
+from pathlib import Path
+
+import dagster as dg
+
+from dagster_demo.defs.assets import DUCKDB_WRITE_TAG
+from dagster_demo.export import EXPORTS, export_tables
+from dagster_demo.resources.duckdb import DuckDBResource
+from dagster_demo.warehouse import published_path
+
+# Directory (next to dev.duckdb) that downstream readers scan
+EXPORT_DIR = "exports"
+
+
+@dg.asset(
+    group_name="export",
+    description="Export marts and facts to Hive-partitioned Parquet for BI and notebooks",
+    # A read-only DuckDB connection still can't coexist with another process writing
+    tags=DUCKDB_WRITE_TAG,
+    deps=[
+        dg.AssetKey(["marts", "mart_student_dashboard"]),
+        dg.AssetKey(["marts", "mart_class_summary"]),
+        dg.AssetKey(["facts", "fct_student_snapshot"]),
+        dg.AssetKey(["facts", "fct_student_weekly"]),
+        dg.AssetKey(["facts", "fct_grade"]),
+        dg.AssetKey(["facts", "fct_attendance"]),
+        dg.AssetKey(["facts", "fct_assessment"]),
+    ],
+)
+def parquet_export(duckdb: dg.ResourceParam[DuckDBResource]) -> dg.MaterializeResult:
+    """Rewrite the Parquet partitions whose contents changed since the last export."""
+    database_path = Path(duckdb.database_path)
+    export_root = database_path.parent / EXPORT_DIR
+    with duckdb.get_connection(str(published_path(database_path)), read_only=True) as conn:
+        results = export_tables(conn, export_root, EXPORTS)
+    return dg.MaterializeResult(
+        metadata={
+            "path": dg.MetadataValue.path(str(export_root)),
+            "rows": {r.name: r.rows for r in results},
+            "partitions": sum(r.partitions for r in results),
+            "partitions_written": sum(r.written for r in results),
+            "partitions_unchanged": sum(r.unchanged for r in results),
+            "partitions_deleted": sum(r.deleted for r in results),
+            "written_by_table": {r.name: r.written for r in results},
+            **duckdb.profile_metadata(),
+        }
+    )
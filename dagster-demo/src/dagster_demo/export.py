@@ -0,0 +1,252 @@
+"""Incremental, Hive-partitioned Parquet export of the marts and facts.
+
+Each table is written under ``<export_root>/<table>/<col>=<value>/.../data_0.parquet``
+(zstd, with DuckDB's per-row-group min/max statistics; rows are sorted within
+each partition so those statistics prune well). Readers scan the files directly
+and never touch the DuckDB file.
+
+A per-partition row hash is kept in ``<table>/_state.json``. On each export only
+partitions whose hash changed are rewritten (each file is swapped in with an
+atomic rename), partitions that disappeared are deleted, and the rest are left
+untouched.
+"""
+
+import json
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    import duckdb
+
+STATE_FILE = "_state.json"
+
+# DuckDB's directory name for a NULL partition value
+HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """How one table is exported.
+
+    Args:
+        name: Export directory name
+        query: SELECT producing the exported rows (may add partition columns)
+        partition_by: Hive partition columns, outermost first (empty = one file)
+        order_by: Sort order within each partition file
+    """
+
+    name: str
+    query: str
+    partition_by: tuple[str, ...] = ()
+    order_by: tuple[str, ...] = ()
+
+
+# Key-only facts get the natural section keys from dim_section (one row per
+# teacher, hence the distinct) and week_number from dim_date, so they
+# partition like the rest
+_WITH_PARTITION_KEYS = """
+    select f.*, s.district_id, s.course_id, s.section_id, d.week_number
+    from main_facts.{table} f
+    left join (
+        select distinct section_key, district_id, course_id, section_id
+        from main_dimensions.dim_section
+    ) s on f.section_key = s.section_key
+    left join main_dimensions.dim_date d on f.date_key = d.date_key
+"""
+
+EXPORTS = (
+    ExportSpec(
+        "mart_student_dashboard",
+        "select * from main_marts.mart_student_dashboard",
+        partition_by=("district_id", "course_id", "section_id"),
+        order_by=("student_id",),
+    ),
+    ExportSpec(
+        "mart_class_summary",
+        "select * from main_marts.mart_class_summary",
+        partition_by=("district_id", "course_id"),
+        order_by=("section_id",),
+    ),
+    ExportSpec(
+        "fct_student_snapshot",
+        "select * from main_facts.fct_student_snapshot",
+        partition_by=("district_id", "course_id", "section_id"),
+        order_by=("student_id",),
+    ),
+    ExportSpec(
+        "fct_student_weekly",
+        "select * from main_facts.fct_student_weekly",
+        partition_by=("district_id", "course_id", "section_id", "week_number"),
+        order_by=("student_id",),
+    ),
+    ExportSpec(
+        "fct_grade",
+        _WITH_PARTITION_KEYS.format(table="fct_grade"),
+        partition_by=("district_id", "course_id", "section_id", "week_number"),
+        order_by=("student_key", "assignment_key"),
+    ),
+    ExportSpec(
+        "fct_attendance",
+        _WITH_PARTITION_KEYS.format(table="fct_attendance"),
+        partition_by=("district_id", "course_id", "section_id", "week_number"),
+        order_by=("student_key", "date_key"),
+    ),
+    ExportSpec(
+        "fct_assessment",
+        "select * from main_facts.fct_assessment",
+        order_by=("student_key",),
+    ),
+)
+
+
+@dataclass
+class ExportResult:
+    """What one table's export did."""
+
+    name: str
+    rows: int
+    partitions: int
+    written: int
+    deleted: int
+
+    @property
+    def unchanged(self) -> int:
+        return self.partitions - self.written
+
+
+def partition_path(columns: tuple[str, ...], values: tuple[Any, ...]) -> str:
+    """Relative Hive path for a partition, escaped the way DuckDB writes it."""
+    return "/".join(
+        f"{column}={HIVE_NULL if value is None else quote(str(value), safe='')}"
+        for column, value in zip(columns, values)
+    )
+
+
+def _read_state(table_dir: Path) -> dict[str, str]:
+    path = table_dir / STATE_FILE
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _write_state(table_dir: Path, state: dict[str, str]) -> None:
+    tmp = table_dir / f".{STATE_FILE}.{uuid.uuid4().hex[:8]}"
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+    os.replace(tmp, table_dir / STATE_FILE)
+
+
+def _publish_partition(staged: Path, target: Path) -> None:
+    """Swap a staged partition's files into place, one atomic rename per file."""
+    target.mkdir(parents=True, exist_ok=True)
+    names = set()
+    for file in staged.glob("*.parquet"):
+        os.replace(file, target / file.name)
+        names.add(file.name)
+    for file in target.glob("*.parquet"):
+        if file.name not in names:
+            file.unlink()
+
+
+def _remove_partition(table_dir: Path, relative: str) -> None:
+    """Delete a partition directory and any parents it leaves empty."""
+    if not relative:
+        # Unpartitioned export: the files sit in the table directory itself
+        for file in table_dir.glob("*.parquet"):
+            file.unlink()
+        return
+    path = table_dir / relative
+    shutil.rmtree(path, ignore_errors=True)
+    for parent in path.parents:
+        if parent == table_dir or not parent.exists() or any(parent.iterdir()):
+            break
+        parent.rmdir()
+
+
+def export_table(conn: "duckdb.DuckDBPyConnection", spec: ExportSpec, export_root: Path) -> ExportResult:
+    """Export one table, rewriting only the partitions whose contents changed."""
+    table_dir = export_root / spec.name
+    table_dir.mkdir(parents=True, exist_ok=True)
+    columns = spec.partition_by
+    group_by = ", ".join(columns)
+
+    # Per-table names keep each table's statements (and query profiles) distinct
+    source = f"export_{spec.name}"
+    changed_table = f"{source}_changed"
+    conn.execute(f"CREATE OR REPLACE TEMP VIEW {source} AS {spec.query}")
+    hashes = conn.execute(f"""
+        SELECT {group_by + ',' if columns else ''} count(*), sum(hash(t)::hugeint)::varchar
+        FROM {source} t
+        {'GROUP BY ' + group_by if columns else ''}
+    """).fetchall()
+
+    current = {}
+    rows = 0
+    for row in hashes:
+        values, count, digest = row[: len(columns)], row[-2], row[-1]
+        if count:
+            current[partition_path(columns, values)] = f"{count}:{digest}"
+            rows += count
+
+    previous = _read_state(table_dir)
+    changed = [
+        relative
+        for relative, digest in current.items()
+        if previous.get(relative) != digest or not any((table_dir / relative).glob("*.parquet"))
+    ]
+    removed = [relative for relative in previous if relative not in current]
+
+    if changed:
+        staging = table_dir / f".staging-{uuid.uuid4().hex[:8]}"
+        order_by = f"ORDER BY {', '.join(spec.order_by)}" if spec.order_by else ""
+        try:
+            if columns:
+                changed_set = set(changed)
+                values = [
+                    row[: len(columns)]
+                    for row in hashes
+                    if partition_path(columns, row[: len(columns)]) in changed_set
+                ]
+                conn.execute(f"CREATE OR REPLACE TEMP TABLE {changed_table} AS SELECT {group_by} FROM {source} LIMIT 0")
+                conn.executemany(
+                    f"INSERT INTO {changed_table} VALUES ({', '.join('?' for _ in columns)})", values
+                )
+                match = " AND ".join(f"t.{c} IS NOT DISTINCT FROM c.{c}" for c in columns)
+                conn.execute(f"""
+                    COPY (
+                        SELECT t.* FROM {source} t SEMI JOIN {changed_table} c ON {match}
+                        {order_by}
+                    ) TO '{staging.as_posix()}'
+                    (FORMAT parquet, COMPRESSION zstd, PARTITION_BY ({group_by}))
+                """)
+            else:
+                staging.mkdir()
+                conn.execute(f"""
+                    COPY (SELECT * FROM {source} {order_by})
+                    TO '{(staging / 'data_0.parquet').as_posix()}' (FORMAT parquet, COMPRESSION zstd)
+                """)
+
+            for relative in changed:
+                staged = staging / relative
+                if not staged.is_dir():
+                    raise RuntimeError(f"DuckDB did not write expected partition {spec.name}/{relative}")
+                _publish_partition(staged, table_dir / relative)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    for relative in removed:
+        _remove_partition(table_dir, relative)
+
+    _write_state(table_dir, current)
+    return ExportResult(spec.name, rows, len(current), len(changed), len(removed))
+
+
+def export_tables(
+    conn: "duckdb.DuckDBPyConnection",
+    export_root: Path,
+    specs: tuple[ExportSpec, ...] = EXPORTS,
+) -> list[ExportResult]:
+    """Export every spec (open ``conn`` read-only on the published database)."""
+    return [export_table(conn, spec, export_root) for spec in specs]
@@ -0,0 +1,388 @@
+"""Operator-level DuckDB query profiles and plan regression checks.
+
+With ``DUCKDB_PROFILING=true`` every dbt model (through the
+``enable_model_profiling`` / ``finish_model_profiling`` hooks) and every
+statement issued through ``DuckDBResource`` connections records DuckDB's JSON
+query profile: the physical plan with per-operator timing and cardinality,
+plus the query's latency and peak buffer memory.
+
+Profiles are kept under ``DUCKDB_PROFILE_DIR``::
+
+    runs/<run_id>/<source>/<name>.json   raw profiles of one Dagster run
+    baseline/<source>/<name>.json        accepted profile per model/statement
+
+where ``source`` is ``dbt`` (``name`` is the model) or ``sql`` (``name`` comes
+from ``statement_name``). The first profile of a model becomes its baseline.
+Each later profile is compared with it and flagged when
+
+- the plan shape changed (operators, join types or scanned tables differ), or
+- an operator, or the whole query, got slower than the baseline by more than
+  ``DUCKDB_PROFILE_REGRESSION_PCT`` percent and ``DUCKDB_PROFILE_MIN_MS``
+  milliseconds.
+
+Baselines only move when a profile is accepted explicitly
+(``scripts/profile_report.py --accept``), so a slow drift is still caught.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from dagster_demo.tuning import parse_bool
+
+if TYPE_CHECKING:
+    import duckdb
+
+RUNS_DIR = "runs"
+BASELINE_DIR = "baseline"
+
+# Profile sources: dbt models and DuckDBResource statements
+DBT_SOURCE = "dbt"
+SQL_SOURCE = "sql"
+
+# Number of runs whose raw profiles are kept
+KEEP_RUNS = 20
+
+# Operators listed in the "top operators" metadata table
+TOP_OPERATORS = 5
+
+# extra_info entries that identify a plan (the rest are estimates and expressions)
+PLAN_DETAILS = ("Join Type", "Table")
+
+
+@dataclass(frozen=True)
+class Operator:
+    """One physical operator of a profiled plan, in pre-order."""
+
+    index: int
+    depth: int
+    name: str
+    detail: str
+    # Seconds spent in the operator itself
+    timing: float
+    cardinality: int
+    children: int
+
+
+@dataclass(frozen=True)
+class RegressionPolicy:
+    """How much slower than the baseline counts as a regression."""
+
+    pct: float = 50.0
+    min_ms: float = 20.0
+
+    @classmethod
+    def from_env(cls) -> "RegressionPolicy":
+        return cls(
+            pct=float(os.environ.get("DUCKDB_PROFILE_REGRESSION_PCT") or cls.pct),
+            min_ms=float(os.environ.get("DUCKDB_PROFILE_MIN_MS") or cls.min_ms),
+        )
+
+    def regressed(self, baseline: float, current: float) -> bool:
+        """Whether ``current`` seconds is a regression over ``baseline`` seconds."""
+        return (
+            (current - baseline) * 1000 >= self.min_ms
+            and current > baseline * (1 + self.pct / 100)
+        )
+
+
+def operators(profile: dict[str, Any]) -> list[Operator]:
+    """Flatten a JSON profile's plan tree, parents before children."""
+    flat: list[Operator] = []
+
+    def visit(node: dict[str, Any], depth: int) -> None:
+        info = node.get("extra_info") or {}
+        details = [info[key] for key in PLAN_DETAILS if isinstance(info.get(key), str)]
+        # Tables are "<catalog>.<schema>.<table>"; the catalog is named after the
+        # database file, which differs between in-place and blue/green builds
+        detail = ", ".join(
+            d.split(".", 1)[1] if d.count(".") >= 2 else d for d in details
+        )
+        flat.append(
+            Operator(
+                index=len(flat),
+                depth=depth,
+                name=node.get("operator_name", "").strip(),
+                detail=detail,
+                timing=node.get("operator_timing", 0.0),
+                cardinality=node.get("operator_cardinality", 0),
+                children=len(node.get("children", [])),
+            )
+        )
+        for child in node.get("children", []):
+            visit(child, depth + 1)
+
+    for root in profile.get("children", []):
+        visit(root, 0)
+    return flat
+
+
+def plan_signature(plan: list[Operator]) -> str:
+    """Hash of the plan's shape: operators, join types, tables and tree structure."""
+    shape = [(op.depth, op.name, op.detail, op.children) for op in plan]
+    return hashlib.sha256(json.dumps(shape).encode()).hexdigest()[:16]
+
+
+def statement_name(query: str) -> str:
+    """Stable file name for a SQL statement, ignoring literals and whitespace.
+
+    Statements that differ only in string or numeric literals (paths, offsets,
+    limits) share a name, and therefore a baseline.
+    """
+    normalized = re.sub(r"'(?:[^']|'')*'", "?", query)
+    normalized = re.sub(r"\b\d+(?:\.\d+)?\b", "?", normalized)
+    normalized = " ".join(normalized.lower().split())
+    words = re.findall(r"[a-z_][a-z0-9_.]*", normalized)[:6]
+    prefix = re.sub(r"[^a-z0-9]+", "_", "_".join(words)).strip("_")[:48]
+    return f"{prefix}-{hashlib.sha256(normalized.encode()).hexdigest()[:8]}"
+
+
+@dataclass
+class ProfileComparison:
+    """A profile checked against its baseline."""
+
+    source: str
+    name: str
+    # Seconds
+    latency: float
+    peak_memory: int
+    plan: list[Operator]
+    baseline_latency: float | None = None
+    plan_changed: bool = False
+    # (what, baseline seconds, current seconds)
+    regressions: list[tuple[str, float, float]] = field(default_factory=list)
+
+    @property
+    def flagged(self) -> bool:
+        return self.plan_changed or bool(self.regressions)
+
+    def summary(self) -> str:
+        """One line for logs and the report script."""
+        if self.baseline_latency is None:
+            return f"{self.name}: {self.latency * 1000:.1f} ms (new baseline)"
+        parts = [f"{self.name}: {self.latency * 1000:.1f} ms vs {self.baseline_latency * 1000:.1f} ms"]
+        if self.plan_changed:
+            parts.append("plan changed")
+        parts.extend(
+            f"{what} {before * 1000:.1f} -> {after * 1000:.1f} ms"
+            for what, before, after in self.regressions
+        )
+        return "; ".join(parts)
+
+
+def compare(
+    source: str,
+    name: str,
+    profile: dict[str, Any],
+    baseline: dict[str, Any] | None,
+    policy: RegressionPolicy,
+) -> ProfileComparison:
+    """Compare a profile with its baseline (None: nothing to compare against)."""
+    plan = operators(profile)
+    comparison = ProfileComparison(
+        source=source,
+        name=name,
+        latency=profile.get("latency", 0.0),
+        peak_memory=profile.get("system_peak_buffer_memory", 0),
+        plan=plan,
+    )
+    if baseline is None:
+        return comparison
+
+    baseline_plan = operators(baseline)
+    comparison.baseline_latency = baseline.get("latency", 0.0)
+    comparison.plan_changed = plan_signature(plan) != plan_signature(baseline_plan)
+    if policy.regressed(comparison.baseline_latency, comparison.latency):
+        comparison.regressions.append(("query", comparison.baseline_latency, comparison.latency))
+    # Operators only line up one-to-one while the plan shape is unchanged
+    if not comparison.plan_changed:
+        for before, after in zip(baseline_plan, plan):
+            if policy.regressed(before.timing, after.timing):
+                label = f"#{after.index} {after.name}" + (f" ({after.detail})" if after.detail else "")
+                comparison.regressions.append((label, before.timing, after.timing))
+    return comparison
+
+
+class ProfileStore:
+    """Raw profiles per run and the accepted baseline per model/statement."""
+
+    def __init__(self, root: Path, policy: RegressionPolicy | None = None):
+        self.root = Path(root)
+        self.policy = policy or RegressionPolicy.from_env()
+
+    @classmethod
+    def from_env(cls) -> "ProfileStore | None":
+        """The store configured by DUCKDB_PROFILING/DUCKDB_PROFILE_DIR, or None when off."""
+        if not parse_bool(os.environ.get("DUCKDB_PROFILING", "false")):
+            return None
+        return cls(Path(os.environ["DUCKDB_PROFILE_DIR"]))
+
+    def run_dir(self, run_id: str, source: str) -> Path:
+        """Directory receiving one run's profiles (created if needed)."""
+        path = self.root / RUNS_DIR / run_id / source
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def baseline_path(self, source: str, name: str) -> Path:
+        return self.root / BASELINE_DIR / source / f"{name}.json"
+
+    def runs(self) -> list[Path]:
+        """Run directories, newest first."""
+        runs_dir = self.root / RUNS_DIR
+        if not runs_dir.exists():
+            return []
+        return sorted(
+            (p for p in runs_dir.iterdir() if p.is_dir()),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+
+    def record(self, run_id: str, source: str, name: str, profile: dict[str, Any]) -> ProfileComparison:
+        """Save a profile taken in-process and compare it with the baseline."""
+        _write_json(self.run_dir(run_id, source) / f"{name}.json", profile)
+        return self.compare(source, name, profile)
+
+    def compare(self, source: str, name: str, profile: dict[str, Any]) -> ProfileComparison:
+        """Compare with the baseline; the first profile of a name becomes its baseline."""
+        path = self.baseline_path(source, name)
+        if not path.exists():
+            self.accept(source, name, profile)
+            return compare(source, name, profile, None, self.policy)
+        return compare(source, name, profile, json.loads(path.read_text()), self.policy)
+
+    def accept(self, source: str, name: str, profile: dict[str, Any]) -> None:
+        """Make ``profile`` the baseline for future comparisons."""
+        _write_json(self.baseline_path(source, name), profile)
+
+    def prune(self, keep: int = KEEP_RUNS) -> None:
+        """Remove the raw profiles of all but the newest runs (baselines are kept)."""
+        for path in self.runs()[keep:]:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+def profile_metadata(comparisons: list[ProfileComparison]) -> dict[str, Any]:
+    """Dagster metadata summarizing the profiles taken for one asset."""
+    import dagster as dg
+
+    if not comparisons:
+        return {}
+
+    def ms(seconds: float | None) -> str:
+        return "" if seconds is None else f"{seconds * 1000:.1f}"
+
+    metadata: dict[str, Any] = {
+        "profile/latency_ms": round(sum(c.latency for c in comparisons) * 1000, 1),
+        "profile/peak_memory_mb": round(max(c.peak_memory for c in comparisons) / 2**20, 1),
+        "profile/plan_changed": any(c.plan_changed for c in comparisons),
+        "profile/regressed": any(c.regressions for c in comparisons),
+    }
+    if len(comparisons) > 1:
+        rows = [
+            f"| {c.name} | {ms(c.latency)} | {ms(c.baseline_latency)} | {'changed' if c.plan_changed else ''} |"
+            for c in sorted(comparisons, key=lambda c: c.latency, reverse=True)
+        ]
+        metadata["profile/statements"] = dg.MetadataValue.md(
+            "| Statement | ms | Baseline ms | Plan |\n|---|---:|---:|---|\n" + "\n".join(rows)
+        )
+
+    regressions = [(c, *r) for c in comparisons for r in c.regressions]
+    if regressions:
+        rows = [
+            f"| {c.name} | {what} | {ms(before)} | {ms(after)} |"
+            for c, what, before, after in regressions
+        ]
+        metadata["profile/regressions"] = dg.MetadataValue.md(
+            "| Profile | Operator | Baseline ms | ms |\n|---|---|---:|---:|\n" + "\n".join(rows)
+        )
+
+    top = sorted(
+        ((c, op) for c in comparisons for op in c.plan),
+        key=lambda item: item[1].timing,
+        reverse=True,
+    )[:TOP_OPERATORS]
+    rows = [
+        f"| {c.name} | #{op.index} {op.name} | {op.detail} | {ms(op.timing)} | {op.cardinality:,} |"
+        for c, op in top
+    ]
+    metadata["profile/top_operators"] = dg.MetadataValue.md(
+        "| Profile | Operator | Detail | ms | Rows |\n|---|---|---|---:|---:|\n" + "\n".join(rows)
+    )
+    return metadata
+
+
+class ProfiledConnection:
+    """DuckDB connection proxy that hands each statement's profile to a callback.
+
+    A statement's profile is complete once its result has been consumed, so it
+    is collected lazily: just before the next ``execute`` and on ``close``.
+    Statements without a physical plan (DDL, SET, transaction control) leave
+    the previous profile in place and are skipped, as are results that were
+    only partly read (e.g. a single ``fetchone``).
+    """
+
+    def __init__(
+        self,
+        conn: "duckdb.DuckDBPyConnection",
+        on_profile: Callable[[str, dict[str, Any]], None],
+    ):
+        self._conn = conn
+        self._on_profile = on_profile
+        self._pending: str | None = None
+        conn.execute("SET enable_profiling = 'no_output'")
+
+    def execute(self, query: str, parameters: Any = None) -> "ProfiledConnection":
+        self.flush()
+        if parameters is None:
+            self._conn.execute(query)
+        else:
+            self._conn.execute(query, parameters)
+        self._pending = query
+        return self
+
+    def executemany(self, query: str, parameters: Any = None) -> "ProfiledConnection":
+        # Only the last parameter set would be profiled; not worth recording
+        self.flush()
+        self._conn.executemany(query, parameters)
+        return self
+
+    # Registering or unregistering a frame resets the last profile
+    def register(self, view_name: str, python_object: Any) -> "ProfiledConnection":
+        self.flush()
+        self._conn.register(view_name, python_object)
+        return self
+
+    def unregister(self, view_name: str) -> "ProfiledConnection":
+        self.flush()
+        self._conn.unregister(view_name)
+        return self
+
+    def flush(self) -> None:
+        """Collect the profile of the last statement, if it produced one."""
+        query, self._pending = self._pending, None
+        if query is None:
+            return
+        profile = json.loads(self._conn.get_profiling_information(format="json"))
+        if profile.get("query_name") == query:
+            self._on_profile(query, profile)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
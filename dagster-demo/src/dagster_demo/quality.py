@@ -0,0 +1,180 @@
+"""In-load data quality checks for the extract assets.
+
+Statistics are computed on the DataFrame the extract asset is about to write,
+so the checks cost no extra scan of the DuckDB tables. The checks are declared
+as blocking asset checks: an ERROR result stops downstream dbt models in the
+same run.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import dagster as dg
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+ROW_COUNT_CHECK = "row_count_matches_api"
+NOT_NULL_CHECK = "required_columns_not_null"
+UNIQUE_KEY_CHECK = "key_is_unique"
+DOMAIN_CHECK = "values_in_domain"
+
+# check name -> (passed, metadata) for one shard of a sharded extract
+ShardCheckOutcomes = dict[str, tuple[bool, dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class QualityRules:
+    """Expectations for one raw table.
+
+    Args:
+        key_columns: Columns that together identify a row
+        required_columns: Columns that may not contain nulls (key columns are implied)
+        value_domains: Column-name regex -> allowed values; nulls are not checked here
+        key_severity: Severity of a duplicate-key failure
+    """
+
+    key_columns: tuple[str, ...]
+    required_columns: tuple[str, ...] = ()
+    value_domains: dict[str, frozenset[str]] = field(default_factory=dict)
+    key_severity: dg.AssetCheckSeverity = dg.AssetCheckSeverity.ERROR
+
+
+PERFORMANCE_LEVELS = frozenset({"Below Basic", "Basic", "Proficient", "Advanced"})
+
+ATTENDANCE_RULES = QualityRules(
+    key_columns=("student_id", "course_id", "section_id"),
+    required_columns=("student_name",),
+    # Date columns hold "" (present) or "Absent"; nulls are treated as present downstream
+    value_domains={r"\d{4}-\d{2}-\d{2}": frozenset({"", "Present", "Absent"})},
+)
+
+GRADEBOOK_RULES = QualityRules(
+    key_columns=("student_id", "course_id", "section_id"),
+    required_columns=("student_name", "teacher"),
+)
+
+ISAT_RULES = QualityRules(
+    key_columns=("eduid",),
+    required_columns=("student_name", "course_id", "section_id"),
+    value_domains={
+        r"math_performance_level": PERFORMANCE_LEVELS,
+        r"ela_performance_level": PERFORMANCE_LEVELS,
+    },
+    # The seed data has a few colliding EDUIDs; report them without blocking dbt
+    key_severity=dg.AssetCheckSeverity.WARN,
+)
+
+
+def quality_check_specs(asset: str, rules: QualityRules) -> list[dg.AssetCheckSpec]:
+    """Asset check specs for an extract asset guarded by `rules`."""
+    specs = [
+        dg.AssetCheckSpec(ROW_COUNT_CHECK, asset=asset, blocking=True,
+                          description="Rows loaded equal the API's reported total"),
+        dg.AssetCheckSpec(NOT_NULL_CHECK, asset=asset, blocking=True,
+                          description="Key and required columns contain no nulls"),
+        dg.AssetCheckSpec(UNIQUE_KEY_CHECK, asset=asset, blocking=True,
+                          description=f"{', '.join(rules.key_columns)} is unique"),
+    ]
+    if rules.value_domains:
+        specs.append(
+            dg.AssetCheckSpec(DOMAIN_CHECK, asset=asset, blocking=True,
+                              description="Categorical columns only hold known values")
+        )
+    return specs
+
+
+def run_quality_checks(
+    df: "pd.DataFrame", expected_rows: int, rules: QualityRules
+) -> tuple[list[dg.AssetCheckResult], dict[str, float]]:
+    """Evaluate `rules` on a loaded batch.
+
+    Returns the check results and the per-column null rates (for asset metadata).
+    """
+    row_count = len(df)
+    null_counts = df.isna().sum()
+    null_rates = {
+        column: round(float(count) / row_count, 4) if row_count else 0.0
+        for column, count in null_counts.items()
+    }
+
+    results = [
+        dg.AssetCheckResult(
+            check_name=ROW_COUNT_CHECK,
+            passed=row_count == expected_rows,
+            metadata={"row_count": row_count, "api_total": expected_rows},
+        )
+    ]
+
+    required = [c for c in (*rules.key_columns, *rules.required_columns) if c in df.columns]
+    missing = [c for c in (*rules.key_columns, *rules.required_columns) if c not in df.columns]
+    null_required = {c: int(null_counts[c]) for c in required if null_counts[c]}
+    results.append(
+        dg.AssetCheckResult(
+            check_name=NOT_NULL_CHECK,
+            passed=not null_required and not missing,
+            metadata={"null_counts": null_required, "missing_columns": missing},
+        )
+    )
+
+    duplicates = int(df.duplicated(subset=list(rules.key_columns)).sum()) if not missing else 0
+    results.append(
+        dg.AssetCheckResult(
+            check_name=UNIQUE_KEY_CHECK,
+            passed=duplicates == 0,
+            severity=rules.key_severity,
+            metadata={"duplicate_keys": duplicates, "key_columns": list(rules.key_columns)},
+        )
+    )
+
+    if rules.value_domains:
+        invalid = {}
+        for pattern, allowed in rules.value_domains.items():
+            columns = [c for c in df.columns if re.fullmatch(pattern, str(c))]
+            if not columns:
+                continue
+            values = df[columns]
+            bad = values.notna() & ~values.isin(allowed)
+            counts = bad.sum()
+            invalid.update({c: int(n) for c, n in counts.items() if n})
+        results.append(
+            dg.AssetCheckResult(
+                check_name=DOMAIN_CHECK,
+                passed=not invalid,
+                metadata={"invalid_value_counts": invalid},
+            )
+        )
+
+    return results, null_rates
+
+
+def merge_shard_check_results(
+    outcomes_by_shard: dict[str, ShardCheckOutcomes], rules: QualityRules
+) -> list[dg.AssetCheckResult]:
+    """Combine per-shard outcomes into one result per check.
+
+    A check passes only if it passed on every shard; the metadata carries each
+    failing shard's own check metadata.
+    """
+    check_names: dict[str, None] = {}
+    for outcomes in outcomes_by_shard.values():
+        check_names.update(dict.fromkeys(outcomes))
+
+    results = []
+    for check_name in check_names:
+        shard_outcomes = {
+            shard: outcomes[check_name]
+            for shard, outcomes in outcomes_by_shard.items()
+            if check_name in outcomes
+        }
+        failed = {shard: metadata for shard, (passed, metadata) in shard_outcomes.items() if not passed}
+        results.append(
+            dg.AssetCheckResult(
+                check_name=check_name,
+                passed=not failed,
+                severity=rules.key_severity if check_name == UNIQUE_KEY_CHECK else dg.AssetCheckSeverity.ERROR,
+                metadata={"shards_checked": len(shard_outcomes), "failed_shards": failed},
+            )
+        )
+    return results
@@ -0,0 +1,39 @@
+"""
+Base class for the source-system API resources.
+"""
+
+import time
+from typing import Any
+
+from dagster import ConfigurableResource
+from pydantic import PrivateAttr
+
+
+class ApiResource(ConfigurableResource):
+    """HTTP client settings and GET helper shared by the SIS, LMS and State resources."""
+
+    base_url: str
+    timeout: float = 30.0
+    # Client-side rate limit for this resource instance (None = unlimited)
+    requests_per_second: float | None = None
+
+    _last_request: float = PrivateAttr(default=0.0)
+
+    def _throttle(self) -> None:
+        """Sleep so requests stay under requests_per_second."""
+        if not self.requests_per_second:
+            return
+        wait = self._last_request + 1 / self.requests_per_second - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request = time.monotonic()
+
+    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict:
+        """Make a GET request to the API."""
+        import httpx  # imported lazily to keep code-location load fast
+
+        self._throttle()
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.get(f"{self.base_url}{endpoint}", params=params)
+            response.raise_for_status()
+            return response.json()
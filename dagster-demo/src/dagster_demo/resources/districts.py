@@ -0,0 +1,236 @@
+"""Dagster resource for sharded, multi-district extraction.
+
+With no districts configured the extract assets load the single SIS/LMS/State
+endpoint into raw.* as before. With districts configured, each raw table is
+extracted as one shard per district in a process pool, and every shard writes
+its own Parquet file under a Hive-style path:
+
+    <shard_root>/<table>/district_id=<id>/data.parquet
+
+Shards never share a writer, so throughput scales with worker processes; the
+extract asset then points a raw.* view at the shard directory (see
+``DuckDBResource.create_parquet_view``).
+
+Each API host gets ``max_connections_per_host`` slots shared by all workers,
+and each slot is rate limited to an equal share of
+``requests_per_second_per_host``.
+"""
+
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import dagster as dg
+import yaml
+from dagster import ConfigurableResource
+
+from dagster_demo.quality import QualityRules, ShardCheckOutcomes, run_quality_checks
+from dagster_demo.resources.lms_api import LMSApiResource
+from dagster_demo.resources.sis_api import SISApiResource
+from dagster_demo.resources.state_api import StateApiResource
+
+# district_id written to raw.* when running against a single set of endpoints
+DEFAULT_DISTRICT = "default"
+
+SHARD_FILE = "data.parquet"
+
+# raw table -> (district URL field, API resource, page method, fetch-all method)
+SHARD_SOURCES = {
+    "attendance": ("sis_url", SISApiResource, "get_attendance", "get_all_attendance"),
+    "gradebook": ("lms_url", LMSApiResource, "get_gradebook", "get_all_gradebook"),
+    "isat": ("state_url", StateApiResource, "get_isat", "get_all_isat"),
+}
+
+
+class DistrictConfig(dg.Config):
+    """Source endpoints for one district."""
+
+    district_id: str
+    sis_url: str
+    lms_url: str
+    state_url: str
+
+
+@dataclass
+class ShardResult:
+    """Outcome of extracting one district's shard of a raw table."""
+
+    district_id: str
+    row_count: int
+    columns: list[str]
+    checks: ShardCheckOutcomes
+
+
+@dataclass
+class ShardedExtract:
+    """Outcome of extracting every district's shard of a raw table."""
+
+    shards: list[ShardResult]
+
+    @property
+    def row_count(self) -> int:
+        return sum(shard.row_count for shard in self.shards)
+
+    @property
+    def columns(self) -> list[str]:
+        return max((shard.columns for shard in self.shards), key=len, default=[])
+
+    @property
+    def rows_by_district(self) -> dict[str, int]:
+        return {shard.district_id: shard.row_count for shard in self.shards}
+
+    @property
+    def checks_by_district(self) -> dict[str, ShardCheckOutcomes]:
+        return {shard.district_id: shard.checks for shard in self.shards}
+
+
+def _write_parquet(df: Any, path: Path) -> None:
+    """Write a DataFrame to Parquet, replacing any previous file atomically."""
+    import duckdb
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(f".{path.name}.{os.getpid()}")
+    with duckdb.connect() as conn:
+        conn.register("shard", df)
+        conn.execute(
+            f"COPY shard TO '{staging.as_posix()}' (FORMAT parquet, COMPRESSION zstd)"
+        )
+    os.replace(staging, path)
+
+
+def _extract_shard(
+    table: str,
+    district: dict[str, str],
+    shard_root: str,
+    rules: QualityRules,
+    requests_per_second: float | None,
+    host_slot: Any,
+) -> ShardResult:
+    """Extract one district's shard of `table` (runs in a worker process)."""
+    import pandas as pd
+
+    url_field, resource_cls, get_page, get_all = SHARD_SOURCES[table]
+    api = resource_cls(base_url=district[url_field], requests_per_second=requests_per_second)
+    with host_slot:
+        expected_rows = getattr(api, get_page)(limit=1)["total"]
+        data = getattr(api, get_all)()
+
+    df = pd.DataFrame(data)
+    check_results, _ = run_quality_checks(df, expected_rows, rules)
+    # AssetCheckResult doesn't pickle; send plain values back to the parent
+    checks = {
+        r.check_name: (r.passed, {k: v.value for k, v in r.metadata.items()})
+        for r in check_results
+    }
+
+    shard_dir = Path(shard_root) / table / f"district_id={district['district_id']}"
+    if len(df.columns):
+        _write_parquet(df, shard_dir / SHARD_FILE)
+    else:
+        # Nothing to union for this district
+        shutil.rmtree(shard_dir, ignore_errors=True)
+    return ShardResult(district["district_id"], len(df), list(df.columns), checks)
+
+
+class DistrictsResource(ConfigurableResource):
+    """Districts to extract in sharded mode, plus the per-host limits.
+
+    Leave ``districts`` empty for single-endpoint mode.
+    """
+
+    districts: list[DistrictConfig] = []
+    shard_root: str = "shards"
+    # Worker processes for the fan-out (None = CPU count)
+    max_workers: int | None = None
+    max_connections_per_host: int = 2
+    # Total request rate allowed against one host (None = unlimited)
+    requests_per_second_per_host: float | None = None
+
+    @classmethod
+    def from_file(cls, path: str | Path, **defaults: Any) -> "DistrictsResource":
+        """Build the resource from a YAML file (see districts.example.yaml).
+
+        Values in the file take precedence over ``defaults``; a relative
+        ``shard_root`` is resolved against the file's directory.
+        """
+        with open(path) as file:
+            config = yaml.safe_load(file) or {}
+        if "shard_root" in config:
+            config["shard_root"] = str((Path(path).parent / config["shard_root"]).resolve())
+        return cls(**{**defaults, **config})
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.districts)
+
+    def sis_apis(self, default: SISApiResource) -> dict[str, SISApiResource]:
+        """SIS client per district, or just ``default`` in single-endpoint mode."""
+        if not self.enabled:
+            return {DEFAULT_DISTRICT: default}
+        return {
+            d.district_id: SISApiResource(base_url=d.sis_url, timeout=default.timeout)
+            for d in self.districts
+        }
+
+    def shard_dir(self, table: str) -> Path:
+        """Directory holding every district's shard of `table`."""
+        return Path(self.shard_root) / table
+
+    def _prune_shards(self, table: str) -> None:
+        """Remove shards for districts that are no longer configured."""
+        current = {f"district_id={d.district_id}" for d in self.districts}
+        table_dir = self.shard_dir(table)
+        if table_dir.exists():
+            for path in table_dir.iterdir():
+                if path.is_dir() and path.name not in current:
+                    shutil.rmtree(path, ignore_errors=True)
+
+    def extract(self, table: str, rules: QualityRules) -> ShardedExtract:
+        """Extract every district's shard of `table` across worker processes.
+
+        Args:
+            table: Raw table name (a key of SHARD_SOURCES)
+            rules: Quality rules evaluated on each shard
+
+        Returns:
+            Row counts, columns and check results per district
+        """
+        url_field = SHARD_SOURCES[table][0]
+        per_slot_rate = (
+            self.requests_per_second_per_host / self.max_connections_per_host
+            if self.requests_per_second_per_host
+            else None
+        )
+        hosts = {d.district_id: urlsplit(getattr(d, url_field)).netloc for d in self.districts}
+
+        # spawn: the Dagster step process is multithreaded, so don't fork it
+        context = multiprocessing.get_context("spawn")
+        with context.Manager() as manager, ProcessPoolExecutor(
+            max_workers=min(self.max_workers or os.cpu_count() or 1, len(self.districts)),
+            mp_context=context,
+        ) as pool:
+            slots = {
+                host: manager.BoundedSemaphore(self.max_connections_per_host)
+                for host in set(hosts.values())
+            }
+            futures = [
+                pool.submit(
+                    _extract_shard,
+                    table,
+                    district.model_dump(),
+                    self.shard_root,
+                    rules,
+                    per_slot_rate,
+                    slots[hosts[district.district_id]],
+                )
+                for district in self.districts
+            ]
+            shards = [future.result() for future in futures]
+
+        self._prune_shards(table)
+        return ShardedExtract(shards)
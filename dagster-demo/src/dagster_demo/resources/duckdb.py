@@ -2,12 +2,24 @@
 
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Any, Generator
 
-import duckdb
-import pandas as pd
+from dagster import ConfigurableResource, InitResourceContext
+from pydantic import PrivateAttr
 
-from dagster import ConfigurableResource
+from dagster_demo.profiling import (
+    SQL_SOURCE,
+    ProfileComparison,
+    ProfiledConnection,
+    ProfileStore,
+    profile_metadata,
+    statement_name,
+)
+
+# duckdb and pandas are imported inside methods to keep code-location load fast
+if TYPE_CHECKING:
+    import duckdb
+    import pandas as pd
 
 
 class DuckDBResource(ConfigurableResource):
@@ -15,22 +27,68 @@ class DuckDBResource(ConfigurableResource):
 
     Provides methods for reading and writing data with proper connection management.
     Use the dagster/concurrency_key tag on assets to serialize writes.
+
+    Execution settings (threads, memory_limit, temp_directory,
+    preserve_insertion_order) are passed as connection config; build them with
+    ``DuckDBTuning.settings()`` so they match the dbt profile.
+
+    With ``profile_dir`` set, every statement run on a connection from this
+    resource is profiled and compared with its baseline (see
+    ``dagster_demo.profiling``); assets add ``profile_metadata()`` to their
+    materialization.
     """
 
     database_path: str
+    settings: dict[str, str] = {}
+    profile_dir: str | None = None
+
+    _run_id: str = PrivateAttr(default="manual")
+    _log: Any = PrivateAttr(default=None)
+    _comparisons: dict[str, ProfileComparison] = PrivateAttr(default_factory=dict)
+
+    def setup_for_execution(self, context: InitResourceContext) -> None:
+        self._run_id = context.run_id or "manual"
+        self._log = context.log
 
     @contextmanager
-    def get_connection(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
-        """Get a DuckDB connection context manager."""
-        conn = duckdb.connect(self.database_path)
+    def get_connection(
+        self,
+        database_path: str | None = None,
+        read_only: bool = False,
+    ) -> Generator["duckdb.DuckDBPyConnection", None, None]:
+        """Get a DuckDB connection context manager.
+
+        Args:
+            database_path: Database file to open instead of ``database_path``
+            read_only: Open the file read-only
+        """
+        import duckdb
+
+        conn = duckdb.connect(database_path or self.database_path, read_only=read_only, config=self.settings)
+        if self.profile_dir:
+            conn = ProfiledConnection(conn, self._record_profile)
         try:
             yield conn
         finally:
             conn.close()
 
+    def _record_profile(self, query: str, profile: dict[str, Any]) -> None:
+        store = ProfileStore(Path(self.profile_dir))
+        comparison = store.record(self._run_id, SQL_SOURCE, statement_name(query), profile)
+        self._comparisons[comparison.name] = comparison
+        if comparison.flagged and self._log is not None:
+            self._log.warning(f"Query profile regression: {comparison.summary()}")
+
+    def profile_metadata(self) -> dict[str, Any]:
+        """Metadata for the statements profiled since the last call (empty when off)."""
+        comparisons, self._comparisons = list(self._comparisons.values()), {}
+        if comparisons:
+            ProfileStore(Path(self.profile_dir)).prune()
+        return profile_metadata(comparisons)
+
     def write_dataframe(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         table_name: str,
         schema: str = "raw",
         replace: bool = True
@@ -49,11 +107,60 @@ class DuckDBResource(ConfigurableResource):
         with self.get_connection() as conn:
             conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
             if replace:
-                conn.execute(f"DROP TABLE IF EXISTS {schema}.{table_name}")
-            conn.execute(f"CREATE TABLE {schema}.{table_name} AS SELECT * FROM df")
+                self._drop_relation(conn, table_name, schema)
+            # Registered explicitly: replacement scans only see the caller's
+            # locals, which ProfiledConnection.execute hides
+            conn.register("df", df)
+            try:
+                conn.execute(f"CREATE TABLE {schema}.{table_name} AS SELECT * FROM df")
+            finally:
+                conn.unregister("df")
             return len(df)
 
-    def read_table(self, table_name: str, schema: str = "raw") -> pd.DataFrame:
+    def create_parquet_view(
+        self,
+        table_name: str,
+        shard_dir: str,
+        schema: str = "raw",
+    ) -> None:
+        """Replace a table with a view over Hive-partitioned Parquet shards.
+
+        Args:
+            table_name: Target view name
+            shard_dir: Directory of ``<key>=<value>/*.parquet`` shards
+            schema: Target schema (default: raw)
+        """
+        shards = f"{shard_dir.rstrip('/')}/*/*.parquet"
+        with self.get_connection() as conn:
+            conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+            self._drop_relation(conn, table_name, schema)
+            # Partition values stay strings; union_by_name tolerates shards whose
+            # APIs return a different set of date/assignment columns
+            conn.execute(f"""
+                CREATE VIEW {schema}.{table_name} AS
+                SELECT * FROM read_parquet(
+                    '{shards}',
+                    hive_partitioning = true,
+                    hive_types_autocast = false,
+                    union_by_name = true
+                )
+            """)
+
+    @staticmethod
+    def _drop_relation(conn: "duckdb.DuckDBPyConnection", table_name: str, schema: str) -> None:
+        """Drop a table or view, whichever exists (raw.* switches between them)."""
+        kinds = conn.execute(
+            """
+            SELECT 'TABLE' FROM duckdb_tables() WHERE schema_name = ? AND table_name = ?
+            UNION ALL
+            SELECT 'VIEW' FROM duckdb_views() WHERE schema_name = ? AND view_name = ?
+            """,
+            [schema, table_name, schema, table_name],
+        ).fetchall()
+        for (kind,) in kinds:
+            conn.execute(f"DROP {kind} {schema}.{table_name}")
+
+    def read_table(self, table_name: str, schema: str = "raw") -> "pd.DataFrame":
         """Read a table from DuckDB as a DataFrame."""
         with self.get_connection() as conn:
             return conn.execute(f"SELECT * FROM {schema}.{table_name}").fetchdf()
@@ -2,24 +2,13 @@
 Dagster resource for LMS (Learning Management System) API.
 """
 
-from typing import Any
+from dagster_demo.resources.api import ApiResource
 
-import httpx
-from dagster import ConfigurableResource
 
-
-class LMSApiResource(ConfigurableResource):
+class LMSApiResource(ApiResource):
     """Resource for fetching gradebook data from the LMS API."""
 
     base_url: str = "http://localhost:8002"
-    timeout: float = 30.0
-
-    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict:
-        """Make a GET request to the API."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
 
     def get_gradebook(
         self,
@@ -2,24 +2,13 @@
 Dagster resource for SIS (Student Information System) API.
 """
 
-from typing import Any
+from dagster_demo.resources.api import ApiResource
 
-import httpx
-from dagster import ConfigurableResource
 
-
-class SISApiResource(ConfigurableResource):
+class SISApiResource(ApiResource):
     """Resource for fetching attendance data from the SIS API."""
 
     base_url: str = "http://localhost:8001"
-    timeout: float = 30.0
-
-    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict:
-        """Make a GET request to the API."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
 
     def get_attendance(
         self,
@@ -51,6 +40,28 @@ class SISApiResource(ConfigurableResource):
 
         return all_data
 
+    def get_attendance_events(self, after: int = -1, limit: int = 1000) -> dict:
+        """Fetch pushed attendance events with an offset greater than `after`.
+
+        Returns:
+            ``{"data": [...], "last_offset": <offset of the newest event, or -1>}``
+        """
+        return self._get("/attendance/events", {"after": after, "limit": limit})
+
+    def get_all_attendance_events(self, after: int = -1) -> list[dict]:
+        """Fetch every event after `after`, handling pagination."""
+        all_data = []
+        limit = 1000
+
+        while True:
+            result = self.get_attendance_events(after=after, limit=limit)
+            all_data.extend(result["data"])
+            if len(result["data"]) < limit:
+                break
+            after = result["data"][-1]["offset"]
+
+        return all_data
+
     def health_check(self) -> bool:
         """Check if the API is healthy."""
         try:
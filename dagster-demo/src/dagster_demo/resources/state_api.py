@@ -2,24 +2,13 @@
 Dagster resource for State Reporting API.
 """
 
-from typing import Any
+from dagster_demo.resources.api import ApiResource
 
-import httpx
-from dagster import ConfigurableResource
 
-
-class StateApiResource(ConfigurableResource):
+class StateApiResource(ApiResource):
     """Resource for fetching ISAT data from the State Reporting API."""
 
     base_url: str = "http://localhost:8003"
-    timeout: float = 30.0
-
-    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict:
-        """Make a GET request to the API."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
 
     def get_isat(
         self,
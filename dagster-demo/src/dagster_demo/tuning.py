@@ -0,0 +1,101 @@
+"""DuckDB execution settings shared by the dbt profile and DuckDBResource.
+
+Settings are read from ``DUCKDB_*`` environment variables, with defaults sized
+to the host. ``export_env`` writes the resolved values back to the environment
+so the dbt subprocess launched by DbtProjectComponent (``profiles.yml`` and the
+``apply_duckdb_tuning`` macro) runs with exactly the same configuration as the
+extract assets.
+
+Environment variables:
+    DUCKDB_THREADS: DuckDB worker threads and dbt model concurrency
+    DUCKDB_MEMORY_LIMIT: DuckDB memory_limit (e.g. "4GB"); beyond it, operators spill
+    DUCKDB_TEMP_DIRECTORY: Spill directory for out-of-core joins/aggregates
+    DUCKDB_PRESERVE_INSERTION_ORDER: "true"/"false" default for all statements
+        (dbt replaces it with the ``duckdb_run_settings`` var in dbt_project.yml)
+    DUCKDB_MODEL_OVERRIDES: JSON mapping of dbt model name or folder to settings,
+        e.g. '{"fct_grade": {"memory_limit": "2GB"}}'. When unset, dbt falls
+        back to the ``duckdb_model_overrides`` var in dbt_project.yml. DuckDB
+        settings are database-wide, so dbt only applies them with --threads 1.
+    DUCKDB_PROFILING: "true" to record a JSON query profile for every dbt model
+        and DuckDBResource statement (see ``dagster_demo.profiling``)
+    DUCKDB_PROFILE_DIR: Where profiles and their baselines are kept
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Fraction of physical memory DuckDB may use before spilling to temp_directory
+DEFAULT_MEMORY_FRACTION = 0.75
+
+
+def default_threads() -> int:
+    """One DuckDB thread per available core."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_memory_limit() -> str | None:
+    """A fixed share of physical memory, or None to keep DuckDB's own default."""
+    try:
+        total_bytes = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        # Not available on Windows; DuckDB defaults to 80% of RAM there
+        return None
+    return f"{int(total_bytes * DEFAULT_MEMORY_FRACTION) // (1024 * 1024)}MB"
+
+
+def parse_bool(value: str) -> bool:
+    """Interpret an environment flag such as ``DUCKDB_PROFILING``."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class DuckDBTuning:
+    """Resolved DuckDB settings for one database file."""
+
+    threads: int
+    memory_limit: str | None
+    temp_directory: str
+    preserve_insertion_order: bool = True
+    model_overrides: dict[str, dict[str, str | int | bool]] | None = field(default=None)
+    profiling: bool = False
+    profile_dir: str = ""
+
+    @classmethod
+    def from_env(cls, database_path: Path | str) -> "DuckDBTuning":
+        """Build settings from DUCKDB_* environment variables and host defaults."""
+        overrides = os.environ.get("DUCKDB_MODEL_OVERRIDES")
+        return cls(
+            threads=int(os.environ.get("DUCKDB_THREADS") or default_threads()),
+            memory_limit=os.environ.get("DUCKDB_MEMORY_LIMIT") or default_memory_limit(),
+            temp_directory=os.environ.get("DUCKDB_TEMP_DIRECTORY") or f"{database_path}.tmp",
+            preserve_insertion_order=parse_bool(
+                os.environ.get("DUCKDB_PRESERVE_INSERTION_ORDER", "true")
+            ),
+            model_overrides=json.loads(overrides) if overrides else None,
+            profiling=parse_bool(os.environ.get("DUCKDB_PROFILING", "false")),
+            profile_dir=os.environ.get("DUCKDB_PROFILE_DIR") or f"{database_path}.profiles",
+        )
+
+    def settings(self) -> dict[str, str]:
+        """DuckDB connection config (``duckdb.connect(config=...)``)."""
+        settings = {
+            "threads": str(self.threads),
+            "temp_directory": self.temp_directory,
+            "preserve_insertion_order": str(self.preserve_insertion_order).lower(),
+        }
+        if self.memory_limit:
+            settings["memory_limit"] = self.memory_limit
+        return settings
+
+    def export_env(self) -> None:
+        """Publish the resolved settings so the dbt subprocess inherits them."""
+        for name, value in self.settings().items():
+            os.environ[f"DUCKDB_{name.upper()}"] = value
+        if self.model_overrides is not None:
+            os.environ["DUCKDB_MODEL_OVERRIDES"] = json.dumps(self.model_overrides)
+        os.environ["DUCKDB_PROFILING"] = str(self.profiling).lower()
+        os.environ["DUCKDB_PROFILE_DIR"] = self.profile_dir
@@ -0,0 +1,269 @@
+"""Blue/green versions of the dbt warehouse.
+
+In blue/green mode (``DBT_BUILD_MODE=blue_green``) the extract assets keep
+writing raw.* to ``dev.duckdb``, but dbt never builds in a file anyone is
+reading. Each build goes into a fresh version:
+
+    dbt-demo/warehouse/versions/<version>/warehouse.duckdb
+
+The new version starts as a copy of the current one (so models that don't need
+rebuilding are carried over as-is), refreshes raw.* from ``dev.duckdb``, and
+is published by atomically replacing the ``current`` symlink and ``CURRENT``
+pointer file. Readers that opened the old version keep using it. Versions
+retired longer than the retention window are deleted.
+
+Every file keeps the name ``warehouse.duckdb`` because dbt-duckdb qualifies
+view definitions with the catalog name, which DuckDB takes from the file stem.
+
+Whether a model needs rebuilding is decided by a fingerprint of its compiled
+inputs: its SQL and config checksum, the macros it uses, the fingerprints of
+its parents and, for sources, a row hash of the raw table.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+BUILD_MODE_ENV = "DBT_BUILD_MODE"
+IN_PLACE = "in_place"
+BLUE_GREEN = "blue_green"
+
+# Directory next to dev.duckdb holding the warehouse versions
+WAREHOUSE_DIR = "warehouse"
+WAREHOUSE_FILE = "warehouse.duckdb"
+CURRENT_LINK = "current"
+CURRENT_POINTER = "CURRENT"
+RETIRED_MARKER = "RETIRED"
+
+FINGERPRINT_SCHEMA = "_warehouse"
+FINGERPRINT_TABLE = f"{FINGERPRINT_SCHEMA}.fingerprints"
+
+
+@dataclass(frozen=True)
+class WarehouseVersions:
+    """Versioned warehouse files under ``root`` with an atomic ``current`` pointer.
+
+    Args:
+        root: Directory holding ``versions/``, ``current`` and ``CURRENT``
+        retention: How long a retired version is kept for readers still using it
+    """
+
+    root: Path
+    retention: timedelta = timedelta(hours=24)
+
+    @classmethod
+    def from_env(cls, root: Path) -> "WarehouseVersions | None":
+        """Blue/green settings from the environment, or None for in-place builds.
+
+        Reads DBT_BUILD_MODE (``in_place`` or ``blue_green``) and
+        WAREHOUSE_RETENTION_HOURS (default 24).
+        """
+        mode = os.environ.get(BUILD_MODE_ENV, IN_PLACE)
+        if mode == IN_PLACE:
+            return None
+        if mode != BLUE_GREEN:
+            raise ValueError(f"{BUILD_MODE_ENV} must be {IN_PLACE!r} or {BLUE_GREEN!r}, got {mode!r}")
+        hours = float(os.environ.get("WAREHOUSE_RETENTION_HOURS", "24"))
+        return cls(root=root, retention=timedelta(hours=hours))
+
+    @property
+    def versions_dir(self) -> Path:
+        return self.root / "versions"
+
+    def current(self) -> Path | None:
+        """Path of the published warehouse file, if any version is published."""
+        pointer = self.root / CURRENT_POINTER
+        if not pointer.exists():
+            return None
+        path = self.versions_dir / pointer.read_text().strip() / WAREHOUSE_FILE
+        return path if path.exists() else None
+
+    def create(self) -> Path:
+        """Start a new version as a copy of the current one (or empty)."""
+        version = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+        path = self.versions_dir / version / WAREHOUSE_FILE
+        path.parent.mkdir(parents=True)
+        current = self.current()
+        if current is not None:
+            # Published versions are checkpointed, so the file alone is complete
+            shutil.copyfile(current, path)
+        return path
+
+    def publish(self, path: Path) -> None:
+        """Atomically make ``path`` (a version from ``create``) the current version."""
+        previous = self.current()
+        version = path.parent.name
+
+        _replace_atomically(self.root / CURRENT_POINTER, lambda tmp: tmp.write_text(version + "\n"))
+        try:
+            target = Path("versions") / version
+            _replace_atomically(self.root / CURRENT_LINK, lambda tmp: tmp.symlink_to(target))
+        except OSError:
+            # Symlinks need extra privileges on Windows; the CURRENT file is authoritative
+            pass
+
+        if previous is not None and previous.parent != path.parent:
+            (previous.parent / RETIRED_MARKER).touch()
+
+    def collect_garbage(self) -> list[str]:
+        """Delete versions retired (or abandoned) longer than the retention window.
+
+        Returns:
+            Names of the deleted versions
+        """
+        if not self.versions_dir.exists():
+            return []
+        current = self.current()
+        cutoff = datetime.now(timezone.utc).timestamp() - self.retention.total_seconds()
+        deleted = []
+        for version_dir in self.versions_dir.iterdir():
+            if current is not None and version_dir == current.parent:
+                continue
+            # Retired versions age from retirement; unpublished ones (failed or
+            # in-progress builds) from creation
+            marker = version_dir / RETIRED_MARKER
+            since = (marker if marker.exists() else version_dir).stat().st_mtime
+            if since < cutoff:
+                shutil.rmtree(version_dir, ignore_errors=True)
+                deleted.append(version_dir.name)
+        return deleted
+
+
+def published_path(database_path: Path) -> Path:
+    """The warehouse file readers should use: the published version in
+    blue/green mode, otherwise the in-place database itself.
+
+    Raises:
+        FileNotFoundError: In blue/green mode before any version is published
+    """
+    versions = WarehouseVersions.from_env(database_path.parent / WAREHOUSE_DIR)
+    if versions is None:
+        return database_path
+    current = versions.current()
+    if current is None:
+        raise FileNotFoundError(f"No warehouse version has been published under {versions.root}")
+    return current
+
+
+def _replace_atomically(path: Path, write: Any) -> None:
+    """Create ``path`` via a temporary sibling and rename it into place."""
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def refresh_raw(warehouse_path: Path, ingest_path: Path, tables: list[str]) -> None:
+    """Copy raw.<table> from the ingest database into a warehouse version."""
+    import duckdb
+
+    with duckdb.connect(str(warehouse_path)) as conn:
+        conn.execute(f"ATTACH '{ingest_path.as_posix()}' AS ingest (READ_ONLY)")
+        conn.execute("CREATE SCHEMA IF NOT EXISTS raw")
+        for table in tables:
+            conn.execute(f"CREATE OR REPLACE TABLE raw.{table} AS SELECT * FROM ingest.raw.{table}")
+
+
+def source_fingerprints(ingest_path: Path, sources: Mapping[str, str]) -> dict[str, str]:
+    """Fingerprint raw tables by schema, row count and an order-independent row hash.
+
+    Args:
+        ingest_path: DuckDB file holding raw.*
+        sources: dbt source unique_id -> raw table name
+
+    Returns:
+        source unique_id -> fingerprint (missing tables are left out)
+    """
+    import duckdb
+
+    fingerprints = {}
+    with duckdb.connect(str(ingest_path), read_only=True) as conn:
+        for unique_id, table in sources.items():
+            try:
+                columns = conn.execute(f"DESCRIBE raw.{table}").fetchall()
+                stats = conn.execute(
+                    f"SELECT count(*), sum(hash(t)::hugeint) FROM raw.{table} t"
+                ).fetchone()
+            except duckdb.CatalogException:
+                continue
+            fingerprints[unique_id] = _digest([[c[0], c[1]] for c in columns], stats)
+    return fingerprints
+
+
+def model_fingerprints(
+    manifest: Mapping[str, Any],
+    source_fingerprints: Mapping[str, str],
+    carried_over: Mapping[str, str | None] | None = None,
+) -> dict[str, str | None]:
+    """Fingerprint every model from its definition and its parents' fingerprints.
+
+    A model whose source data, SQL, config, macros or upstream models changed
+    gets a new fingerprint; everything else keeps the previous one.
+
+    Args:
+        manifest: Parsed dbt manifest
+        source_fingerprints: source unique_id -> fingerprint
+        carried_over: Models that are not rebuilt, with the fingerprint recorded
+            for the table the new version holds (None if it was never built).
+            Their children are fingerprinted from these instead of the
+            models' current definitions.
+    """
+    nodes = manifest["nodes"]
+    macros = manifest["macros"]
+    fingerprints: dict[str, str | None] = {**source_fingerprints, **(carried_over or {})}
+
+    def fingerprint(unique_id: str) -> str:
+        if unique_id not in fingerprints:
+            node = nodes[unique_id]
+            depends_on = node["depends_on"]
+            fingerprints[unique_id] = _digest(
+                node["checksum"]["checksum"],
+                node["config"],
+                [macros[m]["macro_sql"] for m in sorted(depends_on["macros"]) if m in macros],
+                # Sources without a raw table yet fingerprint as None
+                [
+                    fingerprint(parent) if parent in nodes else fingerprints.get(parent)
+                    for parent in sorted(depends_on["nodes"])
+                ],
+            )
+        return fingerprints[unique_id]
+
+    return {
+        unique_id: fingerprint(unique_id)
+        for unique_id, node in nodes.items()
+        if node["resource_type"] == "model"
+    }
+
+
+def read_fingerprints(warehouse_path: Path | None) -> dict[str, str]:
+    """Model fingerprints recorded in a warehouse version."""
+    import duckdb
+
+    if warehouse_path is None:
+        return {}
+    with duckdb.connect(str(warehouse_path), read_only=True) as conn:
+        try:
+            return dict(conn.execute(f"SELECT unique_id, fingerprint FROM {FINGERPRINT_TABLE}").fetchall())
+        except duckdb.CatalogException:
+            return {}
+
+
+def write_fingerprints(warehouse_path: Path, fingerprints: Mapping[str, str]) -> None:
+    """Record model fingerprints in a version and checkpoint it for publishing."""
+    import duckdb
+
+    with duckdb.connect(str(warehouse_path)) as conn:
+        conn.execute(f"CREATE SCHEMA IF NOT EXISTS {FINGERPRINT_SCHEMA}")
+        conn.execute(f"CREATE OR REPLACE TABLE {FINGERPRINT_TABLE} (unique_id VARCHAR, fingerprint VARCHAR)")
+        conn.executemany(f"INSERT INTO {FINGERPRINT_TABLE} VALUES (?, ?)", list(fingerprints.items()))
+        conn.execute("CHECKPOINT")
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:16]
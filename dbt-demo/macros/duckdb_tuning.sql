@@ -0,0 +1,126 @@
+-- DuckDB execution settings, driven by the DUCKDB_* environment variables that
+-- dagster_demo.tuning exports (see that module for the full list), plus the
+-- dbt-only duckdb_run_settings var, applied once on-run-start.
+-- DuckDB settings are database-wide, so a per-model override set in a
+-- pre-hook would also apply to every model building concurrently, and its
+-- restore would cut their overrides short. Per-model overrides are therefore
+-- only applied in single-threaded runs (--threads 1) and refused otherwise.
+
+{% macro _duckdb_base_settings() %}
+    {{ return({
+        'threads': env_var('DUCKDB_THREADS', ''),
+        'memory_limit': env_var('DUCKDB_MEMORY_LIMIT', ''),
+        'temp_directory': env_var('DUCKDB_TEMP_DIRECTORY', ''),
+        'preserve_insertion_order': env_var('DUCKDB_PRESERVE_INSERTION_ORDER', ''),
+    }) }}
+{% endmacro %}
+
+
+{% macro _duckdb_model_overrides() %}
+    {#- Overrides keyed by model name or model folder (e.g. "facts") -#}
+    {%- set raw = env_var('DUCKDB_MODEL_OVERRIDES', '') -%}
+    {%- set overrides = fromjson(raw) if raw else var('duckdb_model_overrides', {}) -%}
+    {%- set merged = {} -%}
+    {%- for key, settings in overrides.items() -%}
+        {%- if key in model.fqn -%}
+            {%- do merged.update(settings) -%}
+        {%- endif -%}
+    {%- endfor -%}
+    {{ return(merged) }}
+{% endmacro %}
+
+
+{% macro _duckdb_set(name, value) -%}
+    {%- if value is sameas true or value is sameas false -%}
+        set {{ name }} = {{ value | lower }};
+    {%- else -%}
+        set {{ name }} = '{{ value }}';
+    {%- endif -%}
+{%- endmacro %}
+
+
+{% macro _duckdb_run_settings() %}
+    {%- set settings = _duckdb_base_settings() -%}
+    {%- do settings.update(var('duckdb_run_settings', {})) -%}
+    {{ return(settings) }}
+{% endmacro %}
+
+
+{% macro apply_duckdb_tuning() %}
+    {%- for name, value in _duckdb_run_settings().items() if value != '' %}
+    {{ _duckdb_set(name, value) }}
+    {%- endfor %}
+    select 1;
+{% endmacro %}
+
+
+{% macro apply_model_duckdb_settings() %}
+    {%- set overrides = _duckdb_model_overrides() -%}
+    {%- if overrides and execute and target.threads > 1 -%}
+        {%- do exceptions.raise_compiler_error(
+            "DuckDB settings are database-wide, so the overrides for " ~ model.name
+            ~ " (" ~ (overrides.keys() | sort | join(', ')) ~ ") would also apply to the"
+            ~ " models building alongside it; build it with --threads 1"
+        ) -%}
+    {%- endif %}
+    {%- for name, value in overrides.items() %}
+    {{ _duckdb_set(name, value) }}
+    {%- endfor %}
+    select 1;
+{% endmacro %}
+
+
+{% macro restore_model_duckdb_settings() %}
+    {%- set base = _duckdb_run_settings() -%}
+    {%- for name in _duckdb_model_overrides().keys() %}
+    {%- if base.get(name, '') != '' %}
+    {{ _duckdb_set(name, base[name]) }}
+    {%- else %}
+    reset {{ name }};
+    {%- endif %}
+    {%- endfor %}
+    select 1;
+{% endmacro %}
+
+
+-- Query profiling (DUCKDB_PROFILING=true): DuckDB writes the JSON profile of
+-- each statement to profiling_output, replacing the previous one, so the last
+-- statement with a physical plan before profiling stops wins. For tables that
+-- is the model's CREATE TABLE AS; views are created without running their
+-- query, so they are profiled by a full scan. DUCKDB_PROFILE_DIR must exist
+-- (CachedDbtProjectComponent creates one per Dagster run).
+
+{% macro _duckdb_profiling_enabled() %}
+    {{ return(env_var('DUCKDB_PROFILING', 'false') | lower in ('1', 'true', 'yes', 'on')) }}
+{% endmacro %}
+
+
+{% macro enable_model_profiling() %}
+    {%- if _duckdb_profiling_enabled() %}
+    set enable_profiling = 'json';
+    set profiling_output = '{{ env_var("DUCKDB_PROFILE_DIR") }}/{{ model.name }}.json';
+    {%- endif %}
+    select 1;
+{% endmacro %}
+
+
+{% macro finish_model_profiling() %}
+    {%- if _duckdb_profiling_enabled() %}
+    {%- if model.config.materialized == 'view' %}
+    select * from {{ this }};
+    {%- endif %}
+    pragma disable_profiling;
+    {%- endif %}
+    select 1;
+{% endmacro %}
+
+
+{% macro drop_indexes_on_relation(relation) %}
+    {#- dbt-duckdb's table materialization calls this right after the model's
+        CREATE TABLE AS; stop profiling so its duckdb_indexes() lookups don't
+        replace the model's profile -#}
+    {%- if _duckdb_profiling_enabled() %}
+    {%- do run_query('pragma disable_profiling') %}
+    {%- endif %}
+    {%- do dbt.drop_indexes_on_relation(relation) %}
+{% endmacro %}
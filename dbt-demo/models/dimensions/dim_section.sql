@@ -1,7 +1,9 @@
 -- Dimension table for sections (includes teacher)
+-- Sections belong to a district; course_id is shared across districts
 
 with sections as (
     select distinct
+        district_id,
         course_id,
         section_id,
         teacher_name
@@ -9,7 +11,8 @@ with sections as (
 )
 
 select
-    row_number() over (order by course_id, section_id) as section_key,
+    row_number() over (order by district_id, course_id, section_id) as section_key,
+    district_id,
     course_id,
     section_id,
     teacher_name
@@ -1,8 +1,10 @@
 -- Dimension table for students
 -- Combines student info from gradebook and ISAT data
+-- Student ids are only unique within a district
 
 with gradebook_students as (
     select distinct
+        district_id,
         student_id,
         student_name
     from {{ ref('stg_gradebook') }}
@@ -10,6 +12,7 @@ with gradebook_students as (
 
 isat_students as (
     select distinct
+        district_id,
         eduid,
         student_name
     from {{ ref('stg_isat') }}
@@ -17,15 +20,19 @@ isat_students as (
 
 combined as (
     select
+        g.district_id,
         g.student_id,
         g.student_name,
         i.eduid
     from gradebook_students g
-    left join isat_students i on g.student_name = i.student_name
+    left join isat_students i
+        on g.district_id = i.district_id
+        and g.student_name = i.student_name
 )
 
 select
-    row_number() over (order by student_id) as student_key,
+    row_number() over (order by district_id, student_id) as student_key,
+    district_id,
     student_id,
     student_name,
     eduid
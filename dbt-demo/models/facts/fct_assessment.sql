@@ -18,4 +18,4 @@ select
     i.ela_scale_score,
     i.ela_performance_level
 from isat i
-left join dim_student s on i.eduid = s.eduid
+left join dim_student s on i.district_id = s.district_id and i.eduid = s.eduid
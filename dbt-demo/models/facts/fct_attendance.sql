@@ -30,7 +30,10 @@ select
     a.attendance_status,
     a.is_absent
 from attendance a
-left join dim_student s on a.student_id = s.student_id
+left join dim_student s on a.district_id = s.district_id and a.student_id = s.student_id
 left join dim_course c on a.course_id = c.course_id
-left join dim_section sec on a.course_id = sec.course_id and a.section_id = sec.section_id
+left join dim_section sec
+    on a.district_id = sec.district_id
+    and a.course_id = sec.course_id
+    and a.section_id = sec.section_id
 left join dim_date d on a.school_date = d.full_date
@@ -35,8 +35,11 @@ select
     g.score,
     g.is_submitted
 from grades g
-left join dim_student s on g.student_id = s.student_id
+left join dim_student s on g.district_id = s.district_id and g.student_id = s.student_id
 left join dim_course c on g.course_id = c.course_id
-left join dim_section sec on g.course_id = sec.course_id and g.section_id = sec.section_id
+left join dim_section sec
+    on g.district_id = sec.district_id
+    and g.course_id = sec.course_id
+    and g.section_id = sec.section_id
 left join dim_assignment a on g.assignment_name = a.assignment_name
 left join dim_date d on g.due_date = d.full_date
@@ -26,17 +26,14 @@ dim_section as (
     select * from {{ ref('dim_section') }}
 ),
 
--- Checkpoint dates from Instructions
-checkpoints as (
-    select
-        date '2026-01-23' as week_3_date,
-        date '2026-02-13' as week_6_date,
-        date '2026-03-06' as week_9_date
+weekly as (
+    select * from {{ ref('fct_student_weekly') }}
 ),
 
 -- Grade metrics by student/course
 grade_metrics as (
     select
+        district_id,
         student_id,
         course_id,
         section_id,
@@ -46,18 +43,31 @@ grade_metrics as (
         count(*) - count(score) as missing_assignments,
         round((count(*) - count(score))::numeric / count(*) * 100, 1) as missing_pct,
         -- Current grade
-        max(current_grade) as current_grade,
-        -- Checkpoint grades (cumulative averages)
-        avg(case when due_date <= (select week_3_date from checkpoints) then score end) as week_3_grade,
-        avg(case when due_date <= (select week_6_date from checkpoints) then score end) as week_6_grade,
-        avg(case when due_date <= (select week_9_date from checkpoints) then score end) as week_9_grade
+        max(current_grade) as current_grade
     from grades
-    group by student_id, course_id, section_id
+    group by district_id, student_id, course_id, section_id
+),
+
+-- Checkpoint grades (cumulative averages) looked up from the weekly running totals;
+-- checkpoint dates live in dim_date
+checkpoint_grades as (
+    select
+        district_id,
+        student_id,
+        course_id,
+        section_id,
+        max(cumulative_grade) filter (where checkpoint_name = 'Week 3') as week_3_grade,
+        max(cumulative_grade) filter (where checkpoint_name = 'Week 6') as week_6_grade,
+        max(cumulative_grade) filter (where checkpoint_name = 'Week 9') as week_9_grade
+    from weekly
+    where checkpoint_name is not null
+    group by district_id, student_id, course_id, section_id
 ),
 
 -- Attendance metrics by student/course
 attendance_metrics as (
     select
+        district_id,
         student_id,
         course_id,
         section_id,
@@ -65,12 +75,13 @@ attendance_metrics as (
         sum(case when is_absent then 1 else 0 end) as days_absent,
         round(1.0 - (sum(case when is_absent then 1 else 0 end)::numeric / count(*)), 3) as attendance_pct
     from attendance
-    group by student_id, course_id, section_id
+    group by district_id, student_id, course_id, section_id
 ),
 
 -- Combine all metrics
 combined as (
     select
+        g.district_id,
         g.student_id,
         g.course_id,
         g.section_id,
@@ -81,14 +92,14 @@ combined as (
         g.missing_assignments,
         g.missing_pct,
         -- Checkpoint grades
-        round(g.week_3_grade, 1) as week_3_grade,
-        round(g.week_6_grade, 1) as week_6_grade,
-        round(g.week_9_grade, 1) as week_9_grade,
+        round(cp.week_3_grade, 1) as week_3_grade,
+        round(cp.week_6_grade, 1) as week_6_grade,
+        round(cp.week_9_grade, 1) as week_9_grade,
         -- Trend status (from Instructions)
         case
-            when g.week_9_grade < 60 then 'Failing'
-            when g.week_3_grade < g.week_6_grade and g.week_6_grade < g.week_9_grade then 'Improving'
-            when g.week_3_grade > g.week_6_grade and g.week_6_grade > g.week_9_grade then 'Declining'
+            when cp.week_9_grade < 60 then 'Failing'
+            when cp.week_3_grade < cp.week_6_grade and cp.week_6_grade < cp.week_9_grade then 'Improving'
+            when cp.week_3_grade > cp.week_6_grade and cp.week_6_grade > cp.week_9_grade then 'Declining'
             else 'Fluctuating'
         end as trend_status,
         -- Attendance metrics
@@ -96,8 +107,14 @@ combined as (
         a.days_absent,
         a.attendance_pct
     from grade_metrics g
+    left join checkpoint_grades cp
+        on g.district_id = cp.district_id
+        and g.student_id = cp.student_id
+        and g.course_id = cp.course_id
+        and g.section_id = cp.section_id
     left join attendance_metrics a
-        on g.student_id = a.student_id
+        on g.district_id = a.district_id
+        and g.student_id = a.student_id
         and g.course_id = a.course_id
         and g.section_id = a.section_id
 ),
@@ -109,6 +126,7 @@ final as (
         c.course_key,
         sec.section_key,
         -- Student info
+        cm.district_id,
         s.student_id,
         s.student_name,
         -- Course info
@@ -135,10 +153,13 @@ final as (
         i.ela_scale_score,
         i.ela_performance_level
     from combined cm
-    left join dim_student s on cm.student_id = s.student_id
+    left join dim_student s on cm.district_id = s.district_id and cm.student_id = s.student_id
     left join dim_course c on cm.course_id = c.course_id
-    left join dim_section sec on cm.course_id = sec.course_id and cm.section_id = sec.section_id
-    left join isat i on s.student_name = i.student_name
+    left join dim_section sec
+        on cm.district_id = sec.district_id
+        and cm.course_id = sec.course_id
+        and cm.section_id = sec.section_id
+    left join isat i on cm.district_id = i.district_id and s.student_name = i.student_name
 )
 
 select * from final
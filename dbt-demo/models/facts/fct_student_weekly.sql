@@ -0,0 +1,138 @@
+-- Student weekly fact table
+-- Running cumulative grade for every week of the term, computed in one window pass
+-- Grain: one row per student per course section per week (student ids are unique per district)
+
+with grades as (
+    select * from {{ ref('int_grades_long') }}
+),
+
+dim_date as (
+    select * from {{ ref('dim_date') }}
+),
+
+dim_student as (
+    select * from {{ ref('dim_student') }}
+),
+
+dim_course as (
+    select * from {{ ref('dim_course') }}
+),
+
+-- dim_section has a row (and section_key) per teacher; keep one key per section
+-- so the join below doesn't repeat rows
+dim_section as (
+    select
+        district_id,
+        course_id,
+        section_id,
+        min(section_key) as section_key
+    from {{ ref('dim_section') }}
+    group by district_id, course_id, section_id
+),
+
+-- One row per week; the "as of" date is the checkpoint date if the week has one,
+-- otherwise the last school day of the week
+weeks as (
+    select
+        week_number,
+        coalesce(
+            max(full_date) filter (where is_checkpoint_date),
+            max(full_date) filter (where is_school_day)
+        ) as as_of_date,
+        max(checkpoint_name) as checkpoint_name
+    from dim_date
+    group by week_number
+),
+
+-- Bucket each grade into the first week whose as-of date is on or after its due date.
+-- This is the only scan of int_grades_long; rows without a due date keep a null week.
+weekly_scores as (
+    select
+        g.district_id,
+        g.student_id,
+        g.course_id,
+        g.section_id,
+        w.week_number,
+        sum(g.score) as score_sum,
+        count(g.score) as completed_assignments,
+        count(*) as due_assignments
+    from grades g
+    asof left join weeks w on g.due_date <= w.as_of_date
+    group by g.district_id, g.student_id, g.course_id, g.section_id, w.week_number
+),
+
+-- Every enrolled student/course/section gets a row for every week
+enrollments as (
+    select distinct
+        district_id,
+        student_id,
+        course_id,
+        section_id
+    from weekly_scores
+),
+
+spine as (
+    select
+        e.district_id,
+        e.student_id,
+        e.course_id,
+        e.section_id,
+        w.week_number,
+        w.as_of_date,
+        w.checkpoint_name
+    from enrollments e
+    cross join weeks w
+),
+
+-- Running totals in a single sorted window pass
+cumulative as (
+    select
+        sp.district_id,
+        sp.student_id,
+        sp.course_id,
+        sp.section_id,
+        sp.week_number,
+        sp.as_of_date,
+        sp.checkpoint_name,
+        cast(sum(coalesce(ws.due_assignments, 0)) over running as bigint) as cumulative_due_assignments,
+        cast(sum(coalesce(ws.completed_assignments, 0)) over running as bigint) as cumulative_completed_assignments,
+        sum(ws.score_sum) over running
+            / nullif(sum(coalesce(ws.completed_assignments, 0)) over running, 0) as cumulative_grade
+    from spine sp
+    left join weekly_scores ws
+        on sp.district_id = ws.district_id
+        and sp.student_id = ws.student_id
+        and sp.course_id = ws.course_id
+        and sp.section_id = ws.section_id
+        and sp.week_number = ws.week_number
+    window running as (
+        partition by sp.district_id, sp.student_id, sp.course_id, sp.section_id
+        order by sp.as_of_date
+        rows between unbounded preceding and current row
+    )
+)
+
+select
+    s.student_key,
+    c.course_key,
+    sec.section_key,
+    d.date_key,
+    cu.district_id,
+    cu.student_id,
+    cu.course_id,
+    cu.section_id,
+    cu.week_number,
+    cu.as_of_date,
+    cu.checkpoint_name,
+    -- Measures
+    cu.cumulative_due_assignments,
+    cu.cumulative_completed_assignments,
+    cu.cumulative_grade
+from cumulative cu
+left join dim_student s on cu.district_id = s.district_id and cu.student_id = s.student_id
+left join dim_course c on cu.course_id = c.course_id
+left join dim_section sec
+    on cu.district_id = sec.district_id
+    and cu.course_id = sec.course_id
+    and cu.section_id = sec.section_id
+left join dim_date d on cu.as_of_date = d.full_date
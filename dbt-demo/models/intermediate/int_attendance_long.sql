@@ -5,9 +5,19 @@ with attendance as (
     select * from {{ ref('stg_attendance') }}
 ),
 
+-- Latest pushed status per student/course/section/day; overrides the pulled value
+events as (
+    select district_id, student_id, course_id, section_id, school_date, attendance_status
+    from {{ source('raw', 'attendance_events') }}
+    qualify row_number() over (
+        partition by district_id, student_id, course_id, section_id, school_date
+        order by event_offset desc
+    ) = 1
+),
+
 unpivoted as (
     unpivot attendance
-    on columns(* exclude (student_id, student_name, course_id, section_id))
+    on columns(* exclude (district_id, student_id, student_name, course_id, section_id))
     into
         name date_column
         value attendance_status
@@ -15,15 +25,42 @@ unpivoted as (
 
 parsed as (
     select
+        district_id,
         student_id,
         student_name,
         course_id,
         section_id,
         -- The column name IS the date (e.g., "2026-01-05")
         cast(date_column as date) as school_date,
-        coalesce(attendance_status, 'Present') as attendance_status,
-        attendance_status = 'Absent' as is_absent
+        attendance_status
     from unpivoted
+),
+
+with_events as (
+    select
+        p.district_id,
+        p.student_id,
+        p.student_name,
+        p.course_id,
+        p.section_id,
+        p.school_date,
+        coalesce(e.attendance_status, p.attendance_status) as attendance_status
+    from parsed p
+    left join events e
+        on p.district_id = e.district_id
+        and p.student_id = e.student_id
+        and p.course_id = e.course_id
+        and p.section_id = e.section_id
+        and p.school_date = e.school_date
 )
 
-select * from parsed
+select
+    district_id,
+    student_id,
+    student_name,
+    course_id,
+    section_id,
+    school_date,
+    coalesce(attendance_status, 'Present') as attendance_status,
+    attendance_status = 'Absent' as is_absent
+from with_events
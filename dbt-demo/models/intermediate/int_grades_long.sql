@@ -7,7 +7,7 @@ with gradebook as (
 
 unpivoted as (
     unpivot gradebook
-    on columns(* exclude (student_id, student_name, course_id, section_id, teacher_name, current_grade))
+    on columns(* exclude (district_id, student_id, student_name, course_id, section_id, teacher_name, current_grade))
     into
         name assignment_name
         value score
@@ -15,6 +15,7 @@ unpivoted as (
 
 parsed as (
     select
+        district_id,
         student_id,
         student_name,
         course_id,
@@ -4,6 +4,7 @@
 
 with student_grades as (
     select
+        district_id,
         course_id,
         section_id,
         student_id,
@@ -13,6 +14,7 @@ with student_grades as (
 )
 
 select
+    district_id,
     course_id,
     section_id,
     count(distinct student_id) as total_students,
@@ -26,5 +28,5 @@ select
     sum(case when current_grade >= 60 and current_grade < 70 then 1 else 0 end) as count_d,
     sum(case when current_grade < 60 then 1 else 0 end) as count_f
 from student_grades
-group by course_id, section_id
-order by course_id, section_id
+group by district_id, course_id, section_id
+order by district_id, course_id, section_id
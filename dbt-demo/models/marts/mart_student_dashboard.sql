@@ -10,6 +10,7 @@ with snapshot as (
 final as (
     select
         -- Student identification
+        district_id,
         student_key,
         student_id,
         student_name,
@@ -49,7 +50,8 @@ final as (
         days_absent,
         attendance_pct,
 
-        -- Attendance status flag
+        -- Attendance status flag (this and overall_risk_level are recomputed for
+        -- live attendance updates in dagster_demo/attendance_events.py; keep in sync)
         case
             when attendance_pct < 0.65 then 'Critical'
             when attendance_pct < 0.75 then 'Warning'
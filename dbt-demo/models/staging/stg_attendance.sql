@@ -6,10 +6,11 @@ with source as (
 )
 
 select
+    district_id,
     student_id,
     student_name,
     course_id,
     section_id,
     -- Keep all date columns as-is for unpivoting in intermediate layer
-    * exclude (student_id, student_name, course_id, section_id)
+    * exclude (district_id, student_id, student_name, course_id, section_id)
 from source
@@ -6,6 +6,7 @@ with source as (
 )
 
 select
+    district_id,
     student_id,
     student_name,
     course_id,
@@ -13,5 +14,5 @@ select
     teacher as teacher_name,
     current_grade,
     -- Keep all assignment/test columns as-is for unpivoting in intermediate layer
-    * exclude (student_id, student_name, course_id, section_id, teacher, current_grade)
+    * exclude (district_id, student_id, student_name, course_id, section_id, teacher, current_grade)
 from source
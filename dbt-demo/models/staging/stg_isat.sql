@@ -6,6 +6,7 @@ with source as (
 )
 
 select
+    district_id,
     eduid,
     student_name,
     course_id,
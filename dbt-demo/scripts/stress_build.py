@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Stress test: run the full dbt build on scaled-up seed data under a fixed memory cap.
+
+Replicates the API seed parquet files SCALE times (new student ids, names and
+EDUIDs per copy) into the raw schema of a scratch DuckDB file, then runs
+`dbt build` with DUCKDB_MEMORY_LIMIT pinned so the unpivot and join models have
+to spill to the temp directory instead of running out of memory.
+
+Usage:
+    uv run python scripts/stress_build.py --scale 100 --memory-limit 1GB
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+from dbt.cli.main import dbtRunner
+
+PROJECT_DIR = Path(__file__).parent.parent
+SEEDS_DIR = PROJECT_DIR.parent / "api" / "data"
+
+# raw table -> seed parquet file
+RAW_TABLES = {
+    "attendance": "attendance",
+    "gradebook": "gradebook",
+    "isat": "isat_data",
+}
+
+# Matches dagster_demo.resources.districts.DEFAULT_DISTRICT
+DEFAULT_DISTRICT = "default"
+
+# Matches dagster_demo.attendance_events.EVENT_COLUMNS; left empty at scale
+ATTENDANCE_EVENTS_DDL = """
+    CREATE OR REPLACE TABLE raw.attendance_events (
+        district_id VARCHAR, event_offset BIGINT, received_at TIMESTAMPTZ, student_id BIGINT,
+        course_id VARCHAR, section_id VARCHAR, school_date DATE, attendance_status VARCHAR
+    )
+"""
+
+
+def load_scaled_raw(database_path: Path, scale: int) -> dict[str, int]:
+    """Write SCALE copies of each seed file into raw.* and return row counts."""
+    conn = duckdb.connect(str(database_path))
+    try:
+        conn.execute("CREATE SCHEMA IF NOT EXISTS raw")
+        conn.execute(f"CREATE OR REPLACE TEMP TABLE copies AS SELECT range AS copy FROM range({scale})")
+        counts = {}
+        for table, seed in RAW_TABLES.items():
+            path = (SEEDS_DIR / f"{seed}.parquet").as_posix()
+            # Keep keys unique per copy; dim_student joins ISAT on student_name
+            if table == "isat":
+                key = "eduid || '-' || copy AS eduid"
+            else:
+                key = f"student_id + copy * (SELECT max(student_id) FROM read_parquet('{path}')) AS student_id"
+            conn.execute(f"""
+                CREATE OR REPLACE TABLE raw.{table} AS
+                SELECT '{DEFAULT_DISTRICT}' AS district_id,
+                    * EXCLUDE (copy) REPLACE (student_name || ' #' || copy AS student_name, {key})
+                FROM read_parquet('{path}') CROSS JOIN copies
+            """)
+            counts[table] = conn.execute(f"SELECT count(*) FROM raw.{table}").fetchone()[0]
+        conn.execute(ATTENDANCE_EVENTS_DDL)
+        return counts
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100, help="Copies of the seed data")
+    parser.add_argument("--memory-limit", default="1GB", help="DuckDB memory_limit for the build")
+    parser.add_argument("--threads", type=int, default=None, help="DuckDB/dbt threads")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch directory")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="dbt_stress_"))
+    database_path = work_dir / "stress.duckdb"
+    temp_directory = work_dir / "spill"
+
+    print(f"Loading {args.scale}x seed data into {database_path}...")
+    for table, rows in load_scaled_raw(database_path, args.scale).items():
+        print(f"  raw.{table}: {rows:,} rows")
+
+    os.environ["DBT_DUCKDB_PATH"] = str(database_path)
+    os.environ["DUCKDB_MEMORY_LIMIT"] = args.memory_limit
+    os.environ["DUCKDB_TEMP_DIRECTORY"] = str(temp_directory)
+    if args.threads:
+        os.environ["DUCKDB_THREADS"] = str(args.threads)
+
+    print(f"Running dbt build with memory_limit={args.memory_limit}...")
+    start = time.perf_counter()
+    result = dbtRunner().invoke([
+        "build",
+        "--project-dir", str(PROJECT_DIR),
+        "--profiles-dir", str(PROJECT_DIR),
+        "--target-path", str(work_dir / "target"),
+        "--log-path", str(work_dir / "logs"),
+        "--quiet",
+    ])
+    elapsed = time.perf_counter() - start
+
+    if result.success:
+        print(f"PASS: full build finished in {elapsed:.1f}s under memory_limit={args.memory_limit}")
+    else:
+        print(f"FAIL: build failed after {elapsed:.1f}s: {result.exception or 'see dbt logs'}")
+
+    if args.keep:
+        print(f"Scratch directory kept at {work_dir}")
+    else:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0 if result.success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
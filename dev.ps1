@@ -50,12 +50,13 @@ $stateJob = Start-Job -ScriptBlock {
 
 Write-Host "Starting Dagster dev server on http://localhost:8888..." -ForegroundColor Green
 $dagsterJob = Start-Job -ScriptBlock {
-    param($dir, $dagsterHome, $duckdbPath)
+    param($dir, $dagsterHome, $duckdbPath, $buildMode)
     $env:DAGSTER_HOME = $dagsterHome
     $env:DBT_DUCKDB_PATH = $duckdbPath
+    $env:DBT_BUILD_MODE = $buildMode
     Set-Location $dir
     uv run dg dev --port 8888
-} -ArgumentList (Join-Path $ScriptDir "dagster-demo"), $env:DAGSTER_HOME, $env:DBT_DUCKDB_PATH
+} -ArgumentList (Join-Path $ScriptDir "dagster-demo"), $env:DAGSTER_HOME, $env:DBT_DUCKDB_PATH, $env:DBT_BUILD_MODE
 
 Write-Host ""
 Write-Host "Services started:" -ForegroundColor Blue
@@ -65,7 +66,13 @@ Write-Host "  - State API: http://localhost:8003 (Job: $($stateJob.Id))"
 Write-Host "  - Dagster: http://localhost:8888 (Job: $($dagsterJob.Id))"
 Write-Host ""
 Write-Host "To browse the database:" -ForegroundColor Blue
-Write-Host "  duckdb -ui " -NoNewline; Write-Host "$env:DBT_DUCKDB_PATH" -ForegroundColor Green
+if ($env:DBT_BUILD_MODE -eq "blue_green") {
+    # The CURRENT file names the published version (symlinks may be unavailable)
+    $version = (Get-Content (Join-Path $ScriptDir "dbt-demo\warehouse\CURRENT") -ErrorAction SilentlyContinue)
+    Write-Host "  duckdb -ui " -NoNewline; Write-Host (Join-Path $ScriptDir "dbt-demo\warehouse\versions\$version\warehouse.duckdb") -ForegroundColor Green
+} else {
+    Write-Host "  duckdb -ui " -NoNewline; Write-Host "$env:DBT_DUCKDB_PATH" -ForegroundColor Green
+}
 Write-Host ""
 Write-Host "Press Ctrl+C to stop all services" -ForegroundColor Yellow
 Write-Host ""
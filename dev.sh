@@ -58,7 +58,11 @@ echo "  - State API: http://localhost:8003 (PID: $STATE_PID)"
 echo "  - Dagster: http://localhost:8888 (PID: $DG_PID)"
 echo ""
 echo -e "${BLUE}To browse the database:${NC}"
-echo -e "  duckdb -ui ${GREEN}$DBT_DUCKDB_PATH${NC}"
+if [ "$DBT_BUILD_MODE" = "blue_green" ]; then
+    echo -e "  duckdb -ui ${GREEN}$SCRIPT_DIR/dbt-demo/warehouse/current/warehouse.duckdb${NC}"
+else
+    echo -e "  duckdb -ui ${GREEN}$DBT_DUCKDB_PATH${NC}"
+fi
 echo ""
 echo "Press Ctrl+C to stop all services"
 